@@ -6,15 +6,20 @@ Apple-style simplicity, wired to your backend scraper
 
 import sys
 import json
+import time
 import uuid
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, asdict
 from datetime import datetime
 
-from PySide6.QtWidgets import *
-from PySide6.QtCore import *
-from PySide6.QtGui import *
+from PySide6.QtWidgets import (
+    QAbstractItemView, QApplication, QCheckBox, QComboBox, QDialog, QFileDialog, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem, QMainWindow, QMessageBox, QPushButton,
+    QSplitter, QStatusBar, QTableWidget, QTableWidgetItem, QTextEdit, QVBoxLayout, QWidget
+)
+from PySide6.QtCore import QTimer, QUrl, Qt, Signal
+from PySide6.QtGui import QFont
 from PySide6.QtWebEngineWidgets import QWebEngineView
 
 # Dark Theme Stylesheet
@@ -165,6 +170,10 @@ QSplitter::handle {
 }
 """
 
+# Pre-baked looks for the targeting toggle; swapping the button's own sheet avoids a style unpolish/polish
+_BTN_SUCCESS_QSS = "QPushButton { background-color: #4CAF50; border-color: #45a049; } QPushButton:hover { background-color: #45a049; }"
+_BTN_NEUTRAL_QSS = "QPushButton { background-color: #404040; border-color: #606060; } QPushButton:hover { background-color: #505050; border-color: #4CAF50; }"
+
 
 @dataclass
 class ScrapingRule:
@@ -313,9 +322,10 @@ class VisualElementTargeter(QWidget):
         self.selector_display.setReadOnly(True)
         self.selector_display.setPlaceholderText("Click an element in the browser...")
 
-        self.element_text_display = QTextEdit()
-        self.element_text_display.setReadOnly(True)
+        self.element_text_display = QLabel()
+        self.element_text_display.setWordWrap(True)
         self.element_text_display.setMaximumHeight(60)
+        self.element_text_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
         self.smart_suggestions = QLabel()
         self.smart_suggestions.setStyleSheet("color: #4CAF50; font-weight: bold; padding: 5px;")
@@ -569,15 +579,27 @@ class InteractiveBrowser(QWebEngineView):
         self.poll_timer = QTimer()
         self.poll_timer.timeout.connect(self.check_selection)
         self.is_targeting_active = False
+        self._last_activity = 0.0  # time.monotonic() of the last poll that saw mouse activity
 
     def set_targeting_widget(self, widget):
         self.targeting_widget = widget
 
     def check_selection(self):
         """Check if user selected an element"""
-        check_js = "window._ragSelection || null;"
+        # null: nothing happened since the last poll (or the page is hidden, so the dirty flag is left for later);
+        # '': mouse activity but no click yet; otherwise the selection
+        check_js = ("document.hidden ? null : "
+                    "window._ragDirty ? (window._ragDirty = false, window._ragSelection || '') : null;")
 
         def handle_result(result):
+            # The original 500 ms while the user is moving around the page; after 5 s idle, back off only to
+            # 750 ms so the first hover or click after a pause still shows up promptly
+            if result is not None:
+                self._last_activity = time.monotonic()
+                self.poll_timer.setInterval(500)
+            elif time.monotonic() - self._last_activity > 5.0:
+                self.poll_timer.setInterval(750)
+
             if result:
                 try:
                     data = json.loads(result) if isinstance(result, str) else result
@@ -612,6 +634,7 @@ class InteractiveBrowser(QWebEngineView):
 
         console.log('🎯 Starting smart targeting mode');
         window._ragSelection = null;
+        window._ragDirty = false;  // Set by any interaction; lets idle polls return without touching Python state
 
         let isSelecting = true;
         let highlighted = null;
@@ -688,6 +711,7 @@ class InteractiveBrowser(QWebEngineView):
         // Event handlers
         function handleMouseOver(e) {
             if (isSelecting) {
+                window._ragDirty = true;
                 e.preventDefault();
                 e.stopPropagation();
                 highlight(e.target);
@@ -708,6 +732,7 @@ class InteractiveBrowser(QWebEngineView):
                     text: text,
                     type: elementType
                 });
+                window._ragDirty = true;
 
                 cleanup();
             }
@@ -735,6 +760,7 @@ class InteractiveBrowser(QWebEngineView):
         """
 
         self.page().runJavaScript(js_code)
+        self._last_activity = time.monotonic()
         self.poll_timer.start(500)
 
     def disable_selector_mode(self):
@@ -1019,8 +1045,8 @@ class RulesManager(QWidget):
 
         filename, _ = QFileDialog.getSaveFileName(
             self, "Export Scraper Config",
-            f"{project.name.lower().replace(' ', '_')}_config.yaml",
-            "YAML files (*.yaml *.yml)"
+            f"{project.name.lower().replace(' ', '_')}_config.json",
+            "JSON files (*.json);;YAML files (*.yaml *.yml)"
         )
 
         if filename:
@@ -1059,9 +1085,15 @@ class RulesManager(QWidget):
                 }]
             }
 
-            import yaml
-            with open(filename, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            # JSON unless a YAML name was chosen; the backend's yaml.safe_load reads either
+            if filename.lower().endswith(('.yaml', '.yml')):
+                import yaml
+                from utils.yaml_io import YamlDumper
+                with open(filename, 'w') as f:
+                    yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False, indent=2, sort_keys=False)
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(config_data, f, indent=2)
 
             QMessageBox.information(self, "Export Complete",
                                     f"Scraper config exported to {filename}\n\n"
@@ -1104,17 +1136,21 @@ class RAGDataStudio(QMainWindow):
 
         self.load_btn = QPushButton("🌐 Load")
         self.selector_btn = QPushButton("🎯 Target Elements")
-        self.selector_btn.setProperty("class", "success")
+        self.selector_btn.setStyleSheet(_BTN_SUCCESS_QSS)
 
         toolbar_layout.addWidget(QLabel("URL:"))
         toolbar_layout.addWidget(self.url_input)
         toolbar_layout.addWidget(self.load_btn)
         toolbar_layout.addWidget(self.selector_btn)
 
-        self.browser = InteractiveBrowser()
+        # Chromium is only started on the first Load; until then a label holds its place
+        self.browser = None
+        self._center_layout = center_layout
+        self._browser_placeholder = QLabel("🌐 Enter a URL and click Load to start the browser")
+        self._browser_placeholder.setAlignment(Qt.AlignCenter)
 
         center_layout.addLayout(toolbar_layout)
-        center_layout.addWidget(self.browser)
+        center_layout.addWidget(self._browser_placeholder)
         main_splitter.addWidget(center_widget)
 
         # Right panel - Targeting and rules
@@ -1146,7 +1182,16 @@ class RAGDataStudio(QMainWindow):
         self.selector_btn.clicked.connect(self.toggle_selector_mode)
         self.project_manager.project_selected.connect(self.load_project)
         self.element_targeter.rule_created.connect(self.add_rule_to_project)
-        self.browser.set_targeting_widget(self.element_targeter)
+
+    def _ensure_browser(self) -> InteractiveBrowser:
+        """Create the browser on first use and swap it in for the placeholder"""
+        if self.browser is None:
+            self.browser = InteractiveBrowser()
+            self.browser.set_targeting_widget(self.element_targeter)
+            self._center_layout.replaceWidget(self._browser_placeholder, self.browser)
+            self._browser_placeholder.deleteLater()
+            self._browser_placeholder = None
+        return self.browser
 
     def load_page(self):
         """Load page in browser"""
@@ -1154,24 +1199,20 @@ class RAGDataStudio(QMainWindow):
         if url:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
-            self.browser.load(QUrl(url))
+            self._ensure_browser().load(QUrl(url))
             self.status_bar.showMessage(f"Loading: {url}")
 
     def toggle_selector_mode(self):
         """Toggle visual element targeting mode"""
         if self.selector_btn.text() == "🎯 Target Elements":
-            self.browser.enable_selector_mode()
+            self._ensure_browser().enable_selector_mode()
             self.selector_btn.setText("❌ Stop Targeting")
-            self.selector_btn.setProperty("class", "")
-            self.selector_btn.style().unpolish(self.selector_btn)
-            self.selector_btn.style().polish(self.selector_btn)
+            self.selector_btn.setStyleSheet(_BTN_NEUTRAL_QSS)
             self.status_bar.showMessage("🎯 Targeting mode enabled - Click elements to create scraping rules")
         else:
-            self.browser.disable_selector_mode()
+            self._ensure_browser().disable_selector_mode()
             self.selector_btn.setText("🎯 Target Elements")
-            self.selector_btn.setProperty("class", "success")
-            self.selector_btn.style().unpolish(self.selector_btn)
-            self.selector_btn.style().polish(self.selector_btn)
+            self.selector_btn.setStyleSheet(_BTN_SUCCESS_QSS)
             self.status_bar.showMessage("Targeting mode disabled")
 
     def load_project(self, project: ProjectConfig):
@@ -20,16 +20,20 @@ sys.path.insert(0, str(project_root))
 def launch_visual_studio():
     """Launch the main RAG Data Studio visual interface"""
     try:
-        from rag_data_studio.main_application import QApplication, RAGDataStudio, DARK_THEME
+        from rag_data_studio.main_application import QApplication, QtAsyncio, RAGDataStudio, DARK_THEME
 
         app = QApplication(sys.argv)
         app.setApplicationName("RAG Data Studio")
         app.setStyle("Fusion")
+        app.setStyleSheet(DARK_THEME)  # Parsed once here; every window and dialog inherits it
 
         window = RAGDataStudio()
         window.show()
 
-        return app.exec()
+        if QtAsyncio is None:
+            return app.exec()
+        QtAsyncio.run(handle_sigint=True)  # Qt event loop doubling as the asyncio loop, for async slots
+        return 0
     except ImportError as e:
         print(f"❌ Failed to import RAG Data Studio GUI: {e}")
         print("💡 Try installing missing dependencies: pip install PySide6")
@@ -0,0 +1,138 @@
+// rag_data_studio/assets/targeting.js
+// Element targeting for InteractiveBrowser. Installed once per document as a QWebEngineScript in the
+// application world; Python only flips it on and off via window.__ragSetEnabled(true/false).
+(function() {
+    if (window.__ragInstalled) return;
+    window.__ragInstalled = true;
+    window.__ragEnabled = false;
+
+    // State and utility classes that say nothing about what an element is; left out of generated selectors
+    const IGNORED_CLS = new Set(['active', 'show', 'hide', 'open', 'closed', 'd-flex', 'd-none',
+                                 'selected', 'hover', 'focus']);
+
+    let bridge = null;
+    let highlighted = null;
+    let overlay = null;
+    let tooltip = null;
+
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        bridge = channel.objects.bridge;
+    });
+
+    function clearHighlight() {
+        if (highlighted) {
+            highlighted.style.outline = '';
+            highlighted.style.backgroundColor = '';
+            highlighted = null;
+        }
+    }
+
+    function highlight(element) {
+        clearHighlight();
+        element.style.outline = '3px solid #FF5722';
+        element.style.backgroundColor = 'rgba(255, 87, 34, 0.1)';
+        highlighted = element;
+    }
+
+    function showChrome() {
+        overlay = document.createElement('div');
+        overlay.style.cssText = `
+            position: fixed; top: 0; left: 0; width: 100%; height: 100%;
+            background: rgba(76, 175, 80, 0.1); z-index: 999999;
+            pointer-events: none; border: 3px solid #4CAF50;
+        `;
+        document.body.appendChild(overlay);
+
+        tooltip = document.createElement('div');
+        tooltip.style.cssText = `
+            position: fixed; top: 20px; right: 20px;
+            background: #4CAF50; color: white; padding: 10px 15px;
+            border-radius: 6px; z-index: 1000000; font-family: Arial;
+            font-size: 14px; font-weight: bold;
+        `;
+        tooltip.textContent = '🎯 Click any element to create scraping rule';
+        document.body.appendChild(tooltip);
+    }
+
+    function hideChrome() {
+        clearHighlight();
+        if (overlay) overlay.remove();
+        if (tooltip) tooltip.remove();
+        overlay = tooltip = null;
+    }
+
+    function makeSmartSelector(element) {
+        if (element.id) {
+            return '#' + element.id;
+        }
+
+        let selector = element.tagName.toLowerCase();
+
+        // For table cells, include the row context
+        if (selector === 'td') {
+            let row = element.closest('tr');
+            if (row) {
+                let cellIndex = Array.from(row.children).indexOf(element);
+                selector = `tr td:nth-child(${cellIndex + 1})`;
+            }
+        }
+
+        // For list items
+        if (selector === 'li') {
+            let list = element.closest('ul, ol');
+            if (list) {
+                selector = `${list.tagName.toLowerCase()} li`;
+            }
+        }
+
+        // Add up to two meaningful classes
+        let classes = [];
+        for (const cls of element.classList) {
+            if (!IGNORED_CLS.has(cls)) {
+                classes.push(cls);
+                if (classes.length === 2) break;
+            }
+        }
+        if (classes.length > 0) {
+            selector += '.' + classes.join('.');
+        }
+
+        return selector;
+    }
+    window.__ragMakeSelector = makeSmartSelector;
+
+    function handleMouseOver(e) {
+        if (!window.__ragEnabled) return;
+        e.preventDefault();
+        e.stopPropagation();
+        highlight(e.target);
+    }
+
+    function handleClick(e) {
+        if (!window.__ragEnabled) return;
+        e.preventDefault();
+        e.stopPropagation();
+
+        let payload = JSON.stringify({
+            selector: window.__ragMakeSelector(e.target),
+            text: e.target.textContent.trim(),
+            type: e.target.tagName.toLowerCase()
+        });
+        window.__ragSetEnabled(false);
+        if (bridge) bridge.on_element_selected(payload);
+    }
+
+    window.__ragSetEnabled = function(enabled) {
+        if (enabled === window.__ragEnabled) return;
+        window.__ragEnabled = enabled;
+        if (enabled) {
+            console.log('🎯 Starting smart targeting mode');
+            showChrome();
+        } else {
+            hideChrome();
+        }
+    };
+
+    document.addEventListener('mouseover', handleMouseOver, true);
+    document.addEventListener('click', handleClick, true);
+})();
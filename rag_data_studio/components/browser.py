@@ -6,6 +6,7 @@ import uuid
 import json
 from PySide6.QtCore import Signal, QUrl
 from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebEngineCore import QWebEnginePage
 
 class InteractiveBrowser(QWebEngineView):
     element_selected = Signal(str, str, str)
@@ -17,6 +18,17 @@ class InteractiveBrowser(QWebEngineView):
         self.TARGETING_JS_OVERLAY_ID = f"__dataExtractorOverlay_{uuid.uuid4().hex}"
         self.TARGETING_JS_TOOLTIP_ID = f"__dataExtractorTooltip_{uuid.uuid4().hex}"
         self.TARGETING_JS_SELECTION_VAR = f"__dataExtractorSelection_{uuid.uuid4().hex}"
+        # An explicit reload (context menu / shortcut) means the page may have changed: drop the tester's copy too.
+        for action in (QWebEnginePage.WebAction.Reload, QWebEnginePage.WebAction.ReloadAndBypassCache):
+            self.pageAction(action).triggered.connect(self._invalidate_tested_page)
+
+    def reload(self):
+        self._invalidate_tested_page()
+        super().reload()
+
+    def _invalidate_tested_page(self):
+        from .rule_tester import invalidate_page_cache  # Lazy: browsing doesn't need the tester's HTTP/lxml stack
+        invalidate_page_cache(self.url().toString())
 
     def _get_targeting_js(self):
         return f"""
@@ -7,10 +7,40 @@ import csv
 from typing import List, Dict, Any
 
 from PySide6.QtWidgets import *
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
 from PySide6.QtGui import QColor
 
 
+class _ScrapedItemsModel(QAbstractTableModel):
+    """Table model over the scraped dicts; cells are formatted on demand, so only visible rows cost anything."""
+
+    def __init__(self, items: List[Dict[str, Any]], parent=None):
+        super().__init__(parent)
+        self._items = items
+        self._headers = list(items[0].keys()) if items else ["Result"]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else max(len(self._items), 1)  # One placeholder row when empty
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole: return self._headers[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole: return None
+        if not self._items: return "No data items found."
+        value = self._items[index.row()].get(self._headers[index.column()])
+        cell_value = json.dumps(value, indent=2) if isinstance(value, (list, dict)) else str(
+            value) if value is not None else ""
+        return cell_value[:500]  # Truncate long values
+
+
 class ScrapedDataViewerDialog(QDialog):
     def __init__(self, scraped_data: List[Dict[str, Any]], parent=None, list_name="Scraped Items"):
         super().__init__(parent)
@@ -23,28 +53,14 @@ class ScrapedDataViewerDialog(QDialog):
 
     def init_ui(self):
         layout = QVBoxLayout(self)
-        self.table_widget = QTableWidget()
+        self.table_widget = QTableView()
         self.table_widget.setAlternatingRowColors(True)
         self.table_widget.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        if not self.scraped_data:
-            self.table_widget.setRowCount(1)
-            self.table_widget.setColumnCount(1)
-            self.table_widget.setItem(0, 0, QTableWidgetItem("No data items found."))
-            self.table_widget.horizontalHeader().setStretchLastSection(True)
-        else:
-            headers = list(self.scraped_data[0].keys())
-            self.table_widget.setColumnCount(len(headers))
-            self.table_widget.setHorizontalHeaderLabels(headers)
-            self.table_widget.setRowCount(len(self.scraped_data))
-            for row_idx, item_dict in enumerate(self.scraped_data):
-                for col_idx, header in enumerate(headers):
-                    value = item_dict.get(header)
-                    cell_value = json.dumps(value, indent=2) if isinstance(value, (list, dict)) else str(
-                        value) if value is not None else ""
-                    self.table_widget.setItem(row_idx, col_idx,
-                                              QTableWidgetItem(cell_value[:500]))  # Truncate long values
-            self.table_widget.resizeColumnsToContents()
-            self.table_widget.horizontalHeader().setStretchLastSection(True)
+        self.model = _ScrapedItemsModel(self.scraped_data, self)
+        self.table_widget.setModel(self.model)
+        self.table_widget.horizontalHeader().setResizeContentsPrecision(100)  # Size columns from a sample, not every row
+        self.table_widget.resizeColumnsToContents()
+        self.table_widget.horizontalHeader().setStretchLastSection(True)
 
         button_layout = QHBoxLayout()
         self.save_btn = QPushButton("💾 Save List as...")
@@ -77,6 +93,45 @@ class ScrapedDataViewerDialog(QDialog):
             QMessageBox.critical(self, "Save Error", f"Could not save data: {e}")
 
 
+class _TestResultsModel(QAbstractTableModel):
+    """Table model over a selector-test results dict; cells are formatted on demand for visible rows only."""
+    HEADERS = ("Rule Name", "Status", "Found", "Sample Values")
+    _OK_COLOR, _FAIL_COLOR = QColor(200, 255, 200), QColor(255, 200, 200)  # Light green / light red
+
+    def __init__(self, results: Dict[str, Any], parent=None):
+        super().__init__(parent)
+        self.global_error = str(results["error"]) if "error" in results else None
+        self._rows = [] if self.global_error else list(results.items())
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else (1 if self.global_error else len(self._rows))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole: return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid(): return None
+        col = index.column()
+        if self.global_error:  # e.g. the page could not be fetched
+            return ("Error", self.global_error, None, None)[col] if role == Qt.DisplayRole else None
+        name, result_data = self._rows[index.row()]
+        if col == 1:
+            if role == Qt.BackgroundRole: return self._OK_COLOR if result_data.success else self._FAIL_COLOR
+            if role == Qt.ToolTipRole and not result_data.success: return result_data.error or ''
+        if role != Qt.DisplayRole: return None
+        if col == 0: return name
+        if col == 1: return "✅ Success" if result_data.success else "❌ Failed"
+        if col == 2: return str(result_data.found_count)
+        return "\n---\n".join(result_data.sample_values)
+
+
 # TestResultsDialog (moved from backend_bridge)
 class TestResultsDialog(QDialog):
     def __init__(self, results: Dict[str, Any], parent=None, test_url="N/A"):
@@ -85,35 +140,18 @@ class TestResultsDialog(QDialog):
         self.setModal(True)
         self.resize(800, 600)
         layout = QVBoxLayout(self)
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["Rule Name", "Status", "Found", "Sample Values"])
+        model = _TestResultsModel(results, self)
+        self.results_table = QTableView()
+        self.results_table.setModel(model)
         self.results_table.setAlternatingRowColors(True)
         self.results_table.setWordWrap(True)
-        if "error" in results:
-            self.results_table.setRowCount(1)
-            self.results_table.setItem(0, 0, QTableWidgetItem("Error"))
-            error_item = QTableWidgetItem(results["error"])
-            self.results_table.setItem(0, 1, error_item)
-            self.results_table.setSpan(0, 1, 1, 3)
-        else:
-            self.results_table.setRowCount(len(results))
-            for row, (name, result_data) in enumerate(results.items()):
-                self.results_table.setItem(row, 0, QTableWidgetItem(name))
-                status_text = "✅ Success" if result_data.get('success') else "❌ Failed"
-                status_item = QTableWidgetItem(status_text)
-                if result_data.get('success'):
-                    status_item.setBackground(QColor(200, 255, 200))
-                else:
-                    status_item.setBackground(QColor(255, 200, 200)); status_item.setToolTip(
-                        result_data.get('error', ''))
-                self.results_table.setItem(row, 1, status_item)
-                self.results_table.setItem(row, 2, QTableWidgetItem(str(result_data.get('found_count', 0))))
-                sample_text = "\n---\n".join(result_data.get('sample_values', []))
-                self.results_table.setItem(row, 3, QTableWidgetItem(sample_text))
+        if model.global_error: self.results_table.setSpan(0, 1, 1, 3)
+        # Fixed row height (room for ~3 wrapped lines) instead of measuring every row's text
+        self.results_table.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() * 3)
+        header = self.results_table.horizontalHeader()
+        header.setResizeContentsPrecision(100)  # Size columns once from a sample, not every row
         self.results_table.resizeColumnsToContents()
-        self.results_table.resizeRowsToContents()
-        self.results_table.horizontalHeader().setStretchLastSection(True)
+        header.setStretchLastSection(True)
         close_btn = QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         layout.addWidget(QLabel(f"Test URL: {test_url}"))
@@ -2,7 +2,9 @@
 """
 UI components for managing projects: the list panel and the new/edit dialog.
 """
+import bisect
 import json
+import os
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -10,11 +12,20 @@ from typing import Dict, List, Optional, Any
 from dataclasses import asdict
 
 from PySide6.QtWidgets import *
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Qt, QTimer
 from PySide6.QtGui import QFont
 
 from ..core.models import ProjectConfig, ScrapingRule
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Projects are saved as compact JSON; set DATA_EXTRACTOR_PRETTY_JSON=1 for a human-readable file.
+PRETTY_PROJECTS_JSON = os.environ.get("DATA_EXTRACTOR_PRETTY_JSON") == "1"
+_DOMAINS = ("tennis_stats", "sports_general", "finance", "news", "ecommerce", "custom")
+
 class ProjectManager(QWidget):
     project_selected = Signal(ProjectConfig)
     new_project_requested = Signal()
@@ -22,8 +33,23 @@ class ProjectManager(QWidget):
     def __init__(self):
         super().__init__()
         self.projects: Dict[str, ProjectConfig] = {}
+        self._row_ids: List[str] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._last_selected_id: Optional[str] = None
+        data_dir = Path.home() / ".data_extractor_studio_projects"
+        data_dir.mkdir(parents=True, exist_ok=True)  # Once per process, not on every save/load
+        self._project_path = data_dir / "projects_config.json"
+        self._projects_loaded = False
+        self._store_unreadable = False  # Set when the store exists but failed to parse; saving then leaves it alone
+        # Bursts of edits collapse into one write 500 ms after the last one; flushed on quit.
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self.save_projects_to_disk)
+        QApplication.instance().aboutToQuit.connect(self.flush_pending_save)
         self.init_ui()
-        self.load_projects_from_disk()
+        # Parse the store once the event loop is running so the first paint isn't blocked on disk I/O.
+        QTimer.singleShot(0, self.load_projects_from_disk)
 
     def init_ui(self):
         layout = QVBoxLayout(self)
@@ -48,18 +74,43 @@ class ProjectManager(QWidget):
 
     def add_or_update_project(self, project: ProjectConfig):
         self.projects[project.id] = project
-        self.refresh_project_list_display()
-        self.save_projects_to_disk()
-        for i in range(self.project_list_widget.count()):
-            item = self.project_list_widget.item(i)
-            if item.data(Qt.UserRole) == project.id:
-                self.project_list_widget.setCurrentItem(item)
-                self.on_project_list_item_selected(item)
-                break
+        row = self._place_project_item(project)
+        self.schedule_save()
+        self.project_list_widget.setCurrentRow(row)
+        if project.id != self._last_selected_id:
+            self.on_project_list_item_selected(self.project_list_widget.item(row))
+
+    def _place_project_item(self, project: ProjectConfig) -> int:
+        """Insert or relabel the row for a single project, keeping the list sorted by name. Returns the row."""
+        label = f"{project.name} ({project.domain})"
+        name_of = lambda pid: self.projects[pid].name
+        old_row = self._row_by_id.get(project.id)
+        if old_row is not None:
+            item = self.project_list_widget.item(old_row)
+            item.setText(label)
+            # Still sorted if it fits between its neighbours; only those two names are compared
+            if ((old_row == 0 or name_of(self._row_ids[old_row - 1]) <= project.name)
+                    and (old_row == len(self._row_ids) - 1 or project.name <= name_of(self._row_ids[old_row + 1]))):
+                return old_row
+            self.project_list_widget.takeItem(old_row)
+            del self._row_ids[old_row]
+        else:
+            item = QListWidgetItem(label)
+            item.setData(Qt.UserRole, project.id)
+        row = bisect.bisect_right(self._row_ids, project.name, key=name_of)
+        self.project_list_widget.insertItem(row, item)
+        self._row_ids.insert(row, project.id)
+        # Only rows between the old and new position moved (or, for a new project, every row after it)
+        start, stop = (row, len(self._row_ids)) if old_row is None else (min(old_row, row), max(old_row, row) + 1)
+        for i in range(start, stop): self._row_by_id[self._row_ids[i]] = i
+        return row
 
     def refresh_project_list_display(self):
         self.project_list_widget.clear()
-        for project_id, project_obj in sorted(self.projects.items(), key=lambda item: item[1].name):
+        self._row_ids = [pid for pid, _ in sorted(self.projects.items(), key=lambda item: item[1].name)]
+        self._row_by_id = {pid: i for i, pid in enumerate(self._row_ids)}
+        for project_id in self._row_ids:
+            project_obj = self.projects[project_id]
             item = QListWidgetItem(f"{project_obj.name} ({project_obj.domain})")
             item.setData(Qt.UserRole, project_id)
             self.project_list_widget.addItem(item)
@@ -67,33 +118,60 @@ class ProjectManager(QWidget):
     def on_project_list_item_selected(self, list_item: QListWidgetItem):
         if list_item:
             project_id = list_item.data(Qt.UserRole)
+            if project_id == self._last_selected_id: return  # Already loaded; avoid a redundant rebuild downstream
             project_obj = self.projects.get(project_id)
-            if project_obj: self.project_selected.emit(project_obj)
+            if project_obj:
+                self._last_selected_id = project_id
+                self.project_selected.emit(project_obj)
 
-    def get_project_path(self):
-        data_dir = Path.home() / ".data_extractor_studio_projects"
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "projects_config.json"
+    def get_project_path(self) -> Path:
+        return self._project_path
+
+    def schedule_save(self): self._save_timer.start()  # (Re)starting the timer pushes the write back
+
+    def flush_pending_save(self):
+        if self._save_timer.isActive(): self._save_timer.stop(); self.save_projects_to_disk()
 
     def save_projects_to_disk(self):
+        if not self._projects_loaded: self.load_projects_from_disk()  # Never overwrite the store before reading it
+        if self._store_unreadable:
+            print(f"Not saving projects: {self.get_project_path()} could not be read; fix or move it aside first"); return
         try:
             projects_data_to_save = {pid: asdict(p) for pid, p in self.projects.items()}
-            with open(self.get_project_path(), "w", encoding="utf-8") as f: json.dump(projects_data_to_save, f, indent=2)
+            if orjson is not None:
+                payload = orjson.dumps(projects_data_to_save, option=orjson.OPT_INDENT_2 if PRETTY_PROJECTS_JSON else 0)
+            else:
+                payload = json.dumps(projects_data_to_save, indent=2 if PRETTY_PROJECTS_JSON else None,
+                                     separators=None if PRETTY_PROJECTS_JSON else (",", ":")).encode("utf-8")
+            # Write a sibling temp file and rename it over the store, so a crash mid-write never leaves a torn file.
+            target = self.get_project_path()
+            tmp_path = target.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(payload); f.flush(); os.fsync(f.fileno())
+            tmp_path.replace(target)
             print(f"Projects saved to {self.get_project_path()}")
         except Exception as e: print(f"Error saving projects: {e}")
 
     def load_projects_from_disk(self):
+        if self._projects_loaded: return
+        self._projects_loaded = True
         try:
             project_file = self.get_project_path()
             if project_file.exists():
-                with open(project_file, "r", encoding="utf-8") as f: projects_data_loaded = json.load(f)
+                raw = project_file.read_bytes()
+                projects_data_loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                loaded: Dict[str, ProjectConfig] = {}  # Parse everything before touching self.projects
                 for pid, p_data in projects_data_loaded.items():
                     rules_data = p_data.get("scraping_rules", [])
                     p_data["scraping_rules"] = [ScrapingRule(**{k:v for k,v in rule_data.items() if k in ScrapingRule.__annotations__}) for rule_data in rules_data]
-                    self.projects[pid] = ProjectConfig(**{k:v for k,v in p_data.items() if k in ProjectConfig.__annotations__})
+                    loaded[pid] = ProjectConfig(**{k:v for k,v in p_data.items() if k in ProjectConfig.__annotations__})
+                for pid, project in loaded.items(): self.projects.setdefault(pid, project)
                 self.refresh_project_list_display()
                 print(f"Loaded {len(self.projects)} projects from {project_file}")
-        except Exception as e: print(f"Error loading projects: {e}"); self.projects = {}
+        except Exception as e:
+            # Keep whatever is already in memory (and the list rows that point at it); just don't save over the file.
+            self._store_unreadable = True
+            print(f"Error loading projects: {e}")
 
     def delete_selected_project(self):
         current_item = self.project_list_widget.currentItem()
@@ -101,7 +179,8 @@ class ProjectManager(QWidget):
         project_id = current_item.data(Qt.UserRole); project_name = self.projects[project_id].name
         reply = QMessageBox.question(self, "Delete Project", f"Delete project '{project_name}'?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
         if reply == QMessageBox.Yes:
-            del self.projects[project_id]; self.refresh_project_list_display(); self.save_projects_to_disk()
+            del self.projects[project_id]; self.refresh_project_list_display(); self.schedule_save()
+            if project_id == self._last_selected_id: self._last_selected_id = None
             QMessageBox.information(self, "Project Deleted", f"Project '{project_name}' deleted.")
 
 class ProjectDialog(QDialog):
@@ -113,7 +192,7 @@ class ProjectDialog(QDialog):
     def init_ui(self):
         layout = QVBoxLayout(self); form_layout = QFormLayout()
         self.name_input = QLineEdit(); self.description_input = QTextEdit(); self.description_input.setMaximumHeight(70)
-        self.domain_combo = QComboBox(); self.domain_combo.setEditable(True); self.domain_combo.addItems(["tennis_stats", "sports_general", "finance", "news", "ecommerce", "custom"])
+        self.domain_combo = QComboBox(); self.domain_combo.setEditable(True); self.domain_combo.addItems(_DOMAINS)
         self.websites_input = QTextEdit(); self.websites_input.setPlaceholderText("Enter target URLs, one per line"); self.websites_input.setMaximumHeight(80)
         form_layout.addRow("Project Name*:", self.name_input); form_layout.addRow("Description:", self.description_input)
         form_layout.addRow("Primary Domain*:", self.domain_combo); form_layout.addRow("Target Websites:", self.websites_input)
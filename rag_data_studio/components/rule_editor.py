@@ -3,14 +3,39 @@
 UI components for defining and managing scraping rules.
 """
 import uuid
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional
 
 from PySide6.QtWidgets import *
-from PySide6.QtCore import Signal, Qt
+from PySide6.QtCore import Signal, Slot, Qt, QTimer, QAbstractItemModel, QModelIndex, QSignalBlocker
 from PySide6.QtGui import QFont, QBrush, QColor
 
 from ..core.models import ScrapingRule
 
+# Field-name suggestion filter for str.translate: space -> '_', keep alphanumerics and '_', drop everything else.
+_NAME_TABLE = {i: None for i in range(256) if not (chr(i).isalnum() or chr(i) == '_')}
+_NAME_TABLE[ord(' ')] = '_'
+_EXTRACTIONS = ("text", "attribute", "html", "structured_list")
+_DATA_TYPES = ("string", "number", "boolean", "date", "list_of_strings", "list_of_objects")
+
+
+@lru_cache(maxsize=128)
+def _suggest_name(text: str) -> str:
+    """Field-name suggestion for an element's text; re-selecting the same element is a cache hit."""
+    suggested_name = text.lower().translate(_NAME_TABLE)
+    if not suggested_name.isascii():  # The table only covers Latin-1; filter any remaining code points
+        suggested_name = ''.join(c for c in suggested_name if c.isalnum() or c == '_')
+    return suggested_name[:30]
+
+
+def _walk(rule: ScrapingRule):
+    """Yield every descendant of a rule (not the rule itself), depth first."""
+    stack = list(rule.sub_selectors)
+    while stack:
+        sub = stack.pop()
+        yield sub
+        stack.extend(sub.sub_selectors)
+
 
 class VisualElementTargeter(QWidget):
     rule_created = Signal(ScrapingRule, str)  # Emits rule and parent_id
@@ -22,6 +47,16 @@ class VisualElementTargeter(QWidget):
         self.current_element_text = ""
         self.current_element_type = ""
         self.parent_rule_id: Optional[str] = None
+        # Bursts of browser selection events collapse into one form update per 50 ms idle window.
+        self._pending_selection: Optional[tuple] = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._apply_pending_selection)
+        # Python-side mirrors of widget state read on save/test, kept in sync by the handlers below.
+        self._is_list_enabled = True
+        self._is_list_checked = False
+        self._attr_enabled = False
         self.init_ui()
 
     def init_ui(self):
@@ -34,9 +69,10 @@ class VisualElementTargeter(QWidget):
         self.selector_display = QLineEdit()
         self.selector_display.setReadOnly(True)
         self.selector_display.setPlaceholderText("Click an element in the browser...")
-        self.element_text_display = QTextEdit()
-        self.element_text_display.setReadOnly(True)
+        self.element_text_display = QLabel()
+        self.element_text_display.setWordWrap(True)
         self.element_text_display.setMaximumHeight(60)
+        self.element_text_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
         selection_layout.addRow("CSS Selector:", self.selector_display)
         selection_layout.addRow("Element Text:", self.element_text_display)
         rule_def_group = QGroupBox("Rule Definition")
@@ -51,7 +87,7 @@ class VisualElementTargeter(QWidget):
         advanced_group = QGroupBox("Extraction Options")
         advanced_layout = QFormLayout(advanced_group)
         self.extraction_type_combo = QComboBox()
-        self.extraction_type_combo.addItems(["text", "attribute", "html", "structured_list"])
+        self.extraction_type_combo.addItems(_EXTRACTIONS)
         self.attribute_input = QLineEdit()
         self.attribute_input.setPlaceholderText("e.g., href, src")
         self.attribute_input.setEnabled(False)
@@ -59,7 +95,7 @@ class VisualElementTargeter(QWidget):
         self.is_list_check.setToolTip("For multiple elements. Ignored for 'structured_list'.")
         self.required_check = QCheckBox("This field is required")
         self.data_type_combo = QComboBox()
-        self.data_type_combo.addItems(["string", "number", "boolean", "date", "list_of_strings", "list_of_objects"])
+        self.data_type_combo.addItems(_DATA_TYPES)
         self.data_type_combo.setToolTip("Use 'list_of_objects' for 'structured_list'.")
         self.sub_selector_info_label = QLabel(
             "For 'structured_list', name this rule (e.g., 'players'). Then, add sub-fields to it.")
@@ -104,59 +140,74 @@ class VisualElementTargeter(QWidget):
         self.extraction_type_combo.setEnabled(True)
         self._clear_form()
 
+    # extraction_type -> (attribute input enabled, "is list" checkbox enabled, fixed data type or None to follow the checkbox)
+    _EXTRACTION_TABLE = {
+        "text": (False, True, None),
+        "attribute": (True, True, None),
+        "html": (False, True, None),
+        "structured_list": (False, False, "list_of_objects"),
+    }
+
+    @Slot(str)
     def on_extraction_type_changed(self, extraction_type: str):
         """Handle changes in the extraction type dropdown."""
-        self.attribute_input.setEnabled(extraction_type == "attribute")
+        attribute_enabled, is_list_enabled, data_type = self._EXTRACTION_TABLE.get(
+            extraction_type, self._EXTRACTION_TABLE["text"])
+        self.attribute_input.setEnabled(attribute_enabled)
+        self._attr_enabled = attribute_enabled
         self.sub_selector_info_label.setVisible(extraction_type == "structured_list")
+        # structured_list is always a list of objects, so the simple-list checkbox is unchecked and locked.
+        if not is_list_enabled: self.is_list_check.setChecked(False); self._is_list_checked = False
+        self.is_list_check.setEnabled(is_list_enabled)
+        self._is_list_enabled = is_list_enabled
+        if data_type is None: data_type = "list_of_strings" if self._is_list_checked else "string"
+        self._set_data_type(data_type)
 
-        if extraction_type == "structured_list":
-            # Correct logic: disable the checkbox and ensure it's unchecked.
-            self.is_list_check.setChecked(False)
-            self.is_list_check.setEnabled(False)
-            self.data_type_combo.setCurrentText("list_of_objects")
-        else:
-            # For all other types, the user can decide if it's a list or not.
-            self.is_list_check.setEnabled(True)
-            # Update data type based on whether the now-enabled checkbox is checked.
-            if self.is_list_check.isChecked():
-                self.data_type_combo.setCurrentText("list_of_strings")
-            else:
-                self.data_type_combo.setCurrentText("string")
-
+    @Slot(bool)
     def on_is_list_toggled(self, checked: bool):
         """Update data type when 'is list' checkbox is toggled by user."""
+        self._is_list_checked = checked
         # This handler should only have an effect for non-structured_list types
         if self.extraction_type_combo.currentText() != "structured_list":
-            if checked:
-                self.data_type_combo.setCurrentText("list_of_strings")
-            else:
-                self.data_type_combo.setCurrentText("string")
+            self._set_data_type("list_of_strings" if checked else "string")
+
+    def _set_data_type(self, data_type: str):
+        # Skip no-op writes so currentTextChanged isn't re-emitted for an unchanged value.
+        if self.data_type_combo.currentText() != data_type: self.data_type_combo.setCurrentText(data_type)
 
     def update_selection(self, selector: str, text: str, element_type: str):
         self.current_selector = selector
         self.current_element_text = text
         self.current_element_type = element_type
+        self._pending_selection = (selector, text, element_type)
+        self._update_timer.start()
+
+    @Slot()
+    def _apply_pending_selection(self):
+        if self._pending_selection is None: return
+        selector, text, element_type = self._pending_selection
+        self._pending_selection = None
         self.selector_display.setText(selector)
-        self.element_text_display.setText(text[:200] + "..." if len(text) > 200 else text)
+        display = text if len(text) <= 200 else f"{text[:200]}..."
+        # Re-selecting the same element shouldn't re-layout the preview.
+        if self.element_text_display.text() != display: self.element_text_display.setText(display)
         self.save_btn.setEnabled(bool(selector))
         self.test_btn.setEnabled(bool(selector))
         if not self.field_name_input.text() and text:
-            suggested_name = ''.join(
-                c for c in text.lower().replace(" ", "_").replace(":", "") if c.isalnum() or c == '_')
-            self.field_name_input.setText(suggested_name[:30])
+            self.field_name_input.setText(_suggest_name(text))
 
+    @Slot()
     def save_current_rule(self):
         if not self.current_selector or not self.field_name_input.text(): QMessageBox.warning(self, "Missing Info",
                                                                                               "Select an element and provide a Field Name."); return
         extraction_type = self.extraction_type_combo.currentText()
         # The is_list property for the backend is True if it's a structured list OR if the checkbox is checked for simple types.
-        is_list_for_rule = (extraction_type == "structured_list") or (
-                    self.is_list_check.isEnabled() and self.is_list_check.isChecked())
+        is_list_for_rule = (extraction_type == "structured_list") or (self._is_list_enabled and self._is_list_checked)
 
         rule = ScrapingRule(id=f"rule_{uuid.uuid4().hex[:8]}", name=self.field_name_input.text(),
                             description=self.field_description_input.toPlainText(), selector=self.current_selector,
                             extraction_type=extraction_type,
-                            attribute_name=self.attribute_input.text() if self.attribute_input.isEnabled() else None,
+                            attribute_name=self.attribute_input.text() if self._attr_enabled else None,
                             is_list=is_list_for_rule, data_type=self.data_type_combo.currentText(),
                             required=self.required_check.isChecked(), sub_selectors=[])
         self.rule_created.emit(rule, self.parent_rule_id)
@@ -164,23 +215,134 @@ class VisualElementTargeter(QWidget):
         QMessageBox.information(self, "Rule Saved", f"Rule '{rule.name}' saved!")
 
     def _clear_form(self):
+        self._update_timer.stop(); self._pending_selection = None
         self.field_name_input.clear()
         self.field_description_input.clear()
-        self.is_list_check.setChecked(False)
+        # Reset the linked widgets silently, then sync their dependent state with a single handler call.
+        with QSignalBlocker(self.extraction_type_combo), QSignalBlocker(self.is_list_check), QSignalBlocker(
+                self.data_type_combo):
+            self.is_list_check.setChecked(False)
+            self._is_list_checked = False
+            self.extraction_type_combo.setCurrentIndex(0)
+            self.data_type_combo.setCurrentIndex(0)
+        self.on_extraction_type_changed(self.extraction_type_combo.currentText())
         self.required_check.setChecked(False)
-        self.extraction_type_combo.setCurrentIndex(0)
-        self.data_type_combo.setCurrentIndex(0)
         self.selector_display.clear()
         self.element_text_display.clear()
         self.save_btn.setEnabled(False)
         self.test_btn.setEnabled(False)
 
+    @Slot()
     def test_current_selector_emit(self):
         if not self.current_selector: QMessageBox.warning(self, "No Selector", "No selector to test."); return
         self.test_selector_requested.emit({"name": self.field_name_input.text() or f"test_{self.current_element_type}",
                                            "selector": self.current_selector,
                                            "extract_type": self.extraction_type_combo.currentText(),
-                                           "attribute_name": self.attribute_input.text() if self.attribute_input.isEnabled() else None})
+                                           "attribute_name": self.attribute_input.text() if self._attr_enabled else None})
+
+
+class ScrapingRuleModel(QAbstractItemModel):
+    """Tree model read straight off the ScrapingRule objects; no per-rule Qt item is allocated.
+
+    add_rule/remove_rule own the tree mutation: they append to / delete from the parent's sub_selectors
+    themselves, so callers must not touch sub_selectors too (the rule would be inserted twice). Top-level rules
+    live in the model's own list; recording those on the project stays with the caller."""
+    HEADERS = ("Field Name", "Extract How", "Selector")
+    _LIST_BRUSH = QBrush(QColor("#4CAF50"))
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._roots: List[ScrapingRule] = []
+        self._parent_of: Dict[str, Optional[ScrapingRule]] = {}
+        self._by_id: Dict[str, ScrapingRule] = {}
+        self._row: Dict[str, int] = {}  # rule id -> row among its siblings; parent()/index_of() run per painted index
+
+    def set_rules(self, roots: List[ScrapingRule]):
+        self.beginResetModel()
+        self._roots = list(roots)
+        self._parent_of.clear()
+        self._by_id.clear()
+        self._row.clear()
+        for row, rule in enumerate(self._roots): self._register(rule, None, row)
+        self.endResetModel()
+
+    def _register(self, rule: ScrapingRule, parent: Optional[ScrapingRule], row: int):
+        stack = [(rule, parent, row)]
+        while stack:
+            rule, parent, row = stack.pop()
+            self._parent_of[rule.id] = parent
+            self._by_id[rule.id] = rule
+            self._row[rule.id] = row
+            stack.extend((sub, rule, i) for i, sub in enumerate(rule.sub_selectors))
+
+    def add_rule(self, rule: ScrapingRule, parent_id: Optional[str] = None) -> QModelIndex:
+        """Append a rule (under parent_id, if given); this also attaches it to the parent's sub_selectors."""
+        parent = self._by_id.get(parent_id) if parent_id else None
+        siblings = self._children(parent)
+        parent_index = self.index_of(parent) if parent is not None else QModelIndex()
+        self.beginInsertRows(parent_index, len(siblings), len(siblings))
+        siblings.append(rule)
+        self._register(rule, parent, len(siblings) - 1)
+        self.endInsertRows()
+        return self.index_of(rule)
+
+    def remove_rule(self, rule_id: str) -> bool:
+        """Remove a rule and its subtree; this also detaches it from the parent's sub_selectors."""
+        rule = self._by_id.get(rule_id)
+        if rule is None: return False
+        parent = self._parent_of[rule_id]
+        row = self._row[rule_id]
+        self.beginRemoveRows(self.index_of(parent) if parent is not None else QModelIndex(), row, row)
+        siblings = self._children(parent)
+        del siblings[row]
+        for r in (rule, *_walk(rule)):
+            self._parent_of.pop(r.id, None); self._by_id.pop(r.id, None); self._row.pop(r.id, None)
+        for i in range(row, len(siblings)): self._row[siblings[i].id] = i  # Later siblings moved up one
+        self.endRemoveRows()
+        return True
+
+    def _children(self, rule: Optional[ScrapingRule]) -> List[ScrapingRule]:
+        return rule.sub_selectors if rule is not None else self._roots
+
+    def rule_at(self, index: QModelIndex) -> Optional[ScrapingRule]:
+        return index.internalPointer() if index.isValid() else None
+
+    def index_of(self, rule: ScrapingRule, column: int = 0) -> QModelIndex:
+        row = self._row.get(rule.id)
+        return self.createIndex(row, column, rule) if row is not None else QModelIndex()  # Invalid for a stale rule
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent): return QModelIndex()
+        return self.createIndex(row, column, self._children(self.rule_at(parent))[row])
+
+    def parent(self, index):
+        rule = self.rule_at(index)
+        parent = self._parent_of.get(rule.id) if rule is not None else None
+        return self.index_of(parent) if parent is not None else QModelIndex()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.column() > 0: return 0
+        return len(self._children(self.rule_at(parent)))
+
+    def columnCount(self, parent=QModelIndex()):
+        return 3
+
+    def data(self, index, role=Qt.DisplayRole):
+        rule = self.rule_at(index)
+        if rule is None: return None
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0: return rule.name
+            if col == 2: return rule.selector
+            if rule.extraction_type == "attribute": return f"{rule.extraction_type} ({rule.attribute_name or 'N/A'})"
+            return rule.extraction_type
+        if role == Qt.ForegroundRole and col == 0 and rule.extraction_type == "structured_list": return self._LIST_BRUSH
+        if role == Qt.UserRole: return rule.id
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole: return self.HEADERS[section]
+        return None
 
 
 class RulesManager(QWidget):
@@ -197,9 +359,11 @@ class RulesManager(QWidget):
         header = QLabel("📋 Defined Selectors")
         header.setFont(QFont("Arial", 14, QFont.Bold))
         header.setStyleSheet("color: #4CAF50; margin: 10px 0;")
-        self.rules_tree = QTreeWidget()
-        self.rules_tree.setColumnCount(3)
-        self.rules_tree.setHeaderLabels(["Field Name", "Extract How", "Selector"])
+        self.model = ScrapingRuleModel(self)
+        self.rules_tree = QTreeView()
+        self.rules_tree.setModel(self.model)
+        self.rules_tree.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.rules_tree.setSelectionMode(QAbstractItemView.SingleSelection)
         self.rules_tree.header().setStretchLastSection(False)
         self.rules_tree.header().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.rules_tree.header().setSectionResizeMode(1, QHeaderView.ResizeToContents)
@@ -215,50 +379,56 @@ class RulesManager(QWidget):
         layout.addWidget(header)
         layout.addWidget(self.rules_tree)
         layout.addLayout(rule_actions_layout)
-        self.rules_tree.itemSelectionChanged.connect(self._on_selection_changed)
+        self.rules_tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self.add_sub_rule_btn.clicked.connect(self._request_add_sub_rule)
         self.delete_rule_btn.clicked.connect(self._request_delete_selected_rule)
 
+    def _selected_rule(self) -> Optional[ScrapingRule]:
+        rows = self.rules_tree.selectionModel().selectedRows()
+        return self.model.rule_at(rows[0]) if rows else None
+
+    @Slot()
     def _on_selection_changed(self):
-        selected_items = self.rules_tree.selectedItems()
-        if not selected_items: self.add_sub_rule_btn.setEnabled(False); self.delete_rule_btn.setEnabled(False); return
-        selected_item = selected_items[0]
-        rule_id = selected_item.data(0, Qt.UserRole)
-        is_structured_list = selected_item.text(1) == "structured_list"
-        self.add_sub_rule_btn.setEnabled(is_structured_list)
+        rule = self._selected_rule()
+        if rule is None: self.add_sub_rule_btn.setEnabled(False); self.delete_rule_btn.setEnabled(False); return
+        self.add_sub_rule_btn.setEnabled(rule.extraction_type == "structured_list")
         self.delete_rule_btn.setEnabled(True)
-        if rule_id: self.rule_selection_changed.emit(rule_id)
+        self.rule_selection_changed.emit(rule.id)
 
+    @Slot()
     def _request_add_sub_rule(self):
-        if self.rules_tree.selectedItems(): self.add_sub_rule_requested.emit(
-            self.rules_tree.selectedItems()[0].data(0, Qt.UserRole))
+        rule = self._selected_rule()
+        if rule is not None: self.add_sub_rule_requested.emit(rule.id)
 
+    @Slot()
     def _request_delete_selected_rule(self):
-        if self.rules_tree.selectedItems(): self.delete_rule_requested.emit(
-            self.rules_tree.selectedItems()[0].data(0, Qt.UserRole))
+        rule = self._selected_rule()
+        if rule is not None: self.delete_rule_requested.emit(rule.id)
+
+    @Slot(ScrapingRule, str)
+    def add_rule(self, rule: ScrapingRule, parent_id: Optional[str] = None):
+        """Insert one rule without rebuilding the tree; set_rules is for the initial load.
+        Matches VisualElementTargeter.rule_created, so the controller connects the two directly. A sub-rule is
+        attached to its parent's sub_selectors here, not by the caller (see ScrapingRuleModel)."""
+        index = self.model.add_rule(rule, parent_id)
+        if index.parent().isValid(): self.rules_tree.expand(index.parent())
+
+    @Slot(str)
+    def remove_rule(self, rule_id: str):
+        """Remove one rule (and its sub-rules) without rebuilding the tree; the answer to delete_rule_requested.
+        Detaching it from the parent's sub_selectors happens here, not in the caller."""
+        if self.model.remove_rule(rule_id): self._on_selection_changed()
 
     def set_rules(self, rules: List[ScrapingRule]):
-        self.rules_tree.clear()
-        rule_map = {rule.id: rule for rule in rules}
-        parent_items = {}
-        processed_ids = set()
-
-        def add_item_to_tree(rule, parent_widget):
-            if rule.id in processed_ids: return
-            item = QTreeWidgetItem(parent_widget)
-            item.setText(0, rule.name)
-            extract_display = rule.extraction_type
-            if rule.extraction_type == "attribute": extract_display += f" ({rule.attribute_name or 'N/A'})"
-            item.setText(1, extract_display)
-            item.setText(2, rule.selector)
-            item.setData(0, Qt.UserRole, rule.id)
-            if rule.extraction_type == "structured_list": item.setForeground(0, QBrush(
-                QColor("#4CAF50"))); item.setExpanded(True)
-            parent_items[rule.id] = item
-            processed_ids.add(rule.id)
-            for sub_rule in rule.sub_selectors:
-                add_item_to_tree(sub_rule, item)
-
-        # Add top-level items first
-        for rule in rules:
-            add_item_to_tree(rule, self.rules_tree)
\ No newline at end of file
+        # A flat list may also contain the sub-rules; only roots go into the model, children hang off their parent.
+        child_ids = {sub.id for r in rules for sub in _walk(r)}
+        top_level = [r for r in rules if r.id not in child_ids]
+        self.model.set_rules(top_level)
+        self.rules_tree.setUpdatesEnabled(False)
+        try:
+            for rule in top_level:
+                for r in (rule, *_walk(rule)):
+                    if r.extraction_type == "structured_list" and r.sub_selectors: self.rules_tree.expand(self.model.index_of(r))
+        finally:
+            self.rules_tree.setUpdatesEnabled(True)
+        self._on_selection_changed()
@@ -1,12 +1,60 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from itertools import islice
 import requests
+from requests.adapters import HTTPAdapter
 import re
+import threading
+import time
+from cssselect import GenericTranslator
+from lxml import etree, html
 from PySide6.QtCore import QThread, Signal
 
+# Shared across tester runs so repeated tests against the same host reuse pooled keep-alive connections.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
 
-@dataclass
+# url -> ((ETag, Last-Modified), parsed tree). Small LRU shared by all tester runs; revalidated with a conditional GET.
+_PAGE_CACHE: "OrderedDict[str, Tuple[Tuple[str, str], html.HtmlElement]]" = OrderedDict()
+_PAGE_CACHE_MAX = 8
+_PAGE_CACHE_LOCK = threading.Lock()
+
+
+def invalidate_page_cache(url: Optional[str] = None):
+    """Drop a cached page (or every page), e.g. when the user explicitly refreshes."""
+    with _PAGE_CACHE_LOCK:
+        if url is None: _PAGE_CACHE.clear()
+        else: _PAGE_CACHE.pop(url, None)
+
+
+@lru_cache(maxsize=256)
+def _compile_selector(selector: str) -> etree.XPath:
+    """Translate a CSS selector to a compiled XPath once; keyed on the selector string, so an edited rule simply misses the cache."""
+    return etree.XPath(GenericTranslator().css_to_xpath(selector))
+
+
+def _text_extractor(elem, rule) -> str:
+    return elem.text_content().strip()
+
+
+def _html_extractor(elem, rule) -> str:
+    s = html.tostring(elem, encoding='unicode', with_tail=False)  # Serialize the subtree once, then slice
+    return s[:100] + "..." if len(s) > 100 else s
+
+
+# extraction_type -> sample extractor, resolved once per rule rather than per matched element.
+_EXTRACTORS = {
+    "text": _text_extractor,
+    "attribute": lambda elem, rule: elem.get(rule.attribute_name, "") if rule.attribute_name else _text_extractor(elem, rule),
+    "html": _html_extractor,
+}
+
+
+@dataclass(slots=True)
 class TestResult:
     rule_name: str
     selector: str
@@ -30,30 +78,55 @@ class RuleTester(QThread):
     def run(self):
         """Test all rules against the target URL"""
         results = []
+        n = len(self.rules)
+        if n == 0:
+            self.progress_update.emit("No rules to test", 100)
+            self.results_ready.emit([])
+            return
 
         try:
             self.progress_update.emit("Fetching page content...", 10)
-            response = requests.get(self.url, timeout=10)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
+            with _PAGE_CACHE_LOCK: cached = _PAGE_CACHE.get(self.url)
+            headers = {}
+            if cached:
+                etag, last_modified = cached[0]
+                if etag: headers["If-None-Match"] = etag
+                if last_modified: headers["If-Modified-Since"] = last_modified
+            # Streamed, so the body is parsed chunk by chunk as it arrives instead of being buffered whole first.
+            with _SESSION.get(self.url, timeout=10, headers=headers, stream=True) as response:
+                if cached and response.status_code == 304:
+                    tree = cached[1]  # Page unchanged since the last run: skip the download and the parse
+                    with _PAGE_CACHE_LOCK:
+                        if self.url in _PAGE_CACHE: _PAGE_CACHE.move_to_end(self.url)
+                else:
+                    response.raise_for_status()
+                    parser = html.HTMLParser()
+                    for chunk in response.iter_content(64 * 1024): parser.feed(chunk)
+                    tree = parser.close()
+                    validators = (response.headers.get("ETag", ""), response.headers.get("Last-Modified", ""))
+                    if any(validators):  # Without validators the page can't be revalidated, so don't keep it
+                        with _PAGE_CACHE_LOCK:
+                            _PAGE_CACHE[self.url] = (validators, tree)
+                            _PAGE_CACHE.move_to_end(self.url)
+                            while len(_PAGE_CACHE) > _PAGE_CACHE_MAX: _PAGE_CACHE.popitem(last=False)
+
+            # Progress crosses the thread boundary as a queued signal; cap it at ~20 emissions per run.
+            last_pct, last_emit_ts = -1, 0.0
+            emit_every = max(1, n // 20)
             for i, rule in enumerate(self.rules):
-                self.progress_update.emit(f"Testing rule: {rule.name}", 20 + (i * 70 // len(self.rules)))
+                if i % emit_every == 0:
+                    pct, now = 20 + (i * 70 // n), time.monotonic()
+                    if pct != last_pct and now - last_emit_ts > 0.05:
+                        self.progress_update.emit(f"Testing rule: {rule.name}", pct)
+                        last_pct, last_emit_ts = pct, now
 
                 try:
-                    elements = soup.select(rule.selector)
+                    elements = _compile_selector(rule.selector)(tree)
                     sample_values = []
 
-                    for elem in elements[:5]:  # Sample first 5 matches
-                        if rule.extraction_type == "text":
-                            value = elem.get_text(strip=True)
-                        elif rule.extraction_type == "attribute" and rule.attribute_name:
-                            value = elem.get(rule.attribute_name, "")
-                        elif rule.extraction_type == "html":
-                            value = str(elem)[:100] + "..." if len(str(elem)) > 100 else str(elem)
-                        else:
-                            value = elem.get_text(strip=True)
+                    extractor = _EXTRACTORS.get(rule.extraction_type, _text_extractor)
+                    for elem in islice(elements, 5):  # Sample first 5 matches
+                        value = extractor(elem, rule)
 
                         if value:
                             sample_values.append(str(value))
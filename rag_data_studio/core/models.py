@@ -7,7 +7,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 import uuid
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingRule:
     """Scraping rule for structured data extraction."""
     id: str
@@ -22,7 +22,7 @@ class ScrapingRule:
     sub_selectors: List['ScrapingRule'] = field(default_factory=list)
     examples: List[str] = field(default_factory=list)
 
-@dataclass
+@dataclass(slots=True)
 class ProjectConfig:
     """Project configuration for structured scraping."""
     id: str
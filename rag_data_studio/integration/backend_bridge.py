@@ -4,19 +4,189 @@ Integration bridge between RAG Data Studio GUI and the scraping backend.
 Focuses on running the pipeline with GUI-generated config and testing selectors.
 """
 
+import asyncio
+import codecs
 import logging  # Use standard logging
-import os
-import tempfile
-from typing import List, Dict, Any, Optional
-
-import yaml
-from PySide6.QtGui import QColor
-# GUI Extensions that were in this file (or a similar one)
-from PySide6.QtWidgets import QDialog, QVBoxLayout, QTableWidget, QTableWidgetItem, QPushButton, QLabel
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from email.message import Message
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple, Callable, Union
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
+
+import aiohttp
+import requests
+from cssselect import GenericTranslator, SelectorError
+from lxml import html as lxml_html, etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
 
 from scraper.rag_models import EnrichedItem  # RAGOutputItem removed
 from scraper.searcher import run_professional_pipeline
-from utils.logger import setup_logger  # Assuming setup_logger is in utils
+
+
+_logger = logging.getLogger("RAGStudioBridge")
+_logger.addHandler(logging.NullHandler())  # Library-style: silent unless the application configures logging
+
+# url -> (ETag, Last-Modified, decoded body or None, lxml tree or None, decoded page size); shared by every bridge and
+# revalidated with a conditional GET. The body is only kept for pages lxml rejected, which need it for the
+# BeautifulSoup fallback. Bounded by total decoded bytes rather than entry count, since pages vary wildly in size.
+_PAGE_CACHE: "OrderedDict[str, Tuple[str, str, Optional[str], Any, int]]" = OrderedDict()
+_PAGE_CACHE_MAX_BYTES = 32 * 1024 * 1024
+_PAGE_CACHE_LOCK = threading.Lock()
+
+
+@dataclass(slots=True)
+class SelectorTestResult:
+    """Outcome of testing one selector on one page."""
+    success: bool = False
+    found_count: int = 0
+    sample_values: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'success': self.success, 'found_count': self.found_count,
+                'sample_values': list(self.sample_values), 'error': self.error}
+
+
+# (url, (selector, extract_type, attribute_name)) -> (expiry, result). Lets Test All / re-tests skip the page
+# entirely when none of the selectors changed; short TTL since the page itself may change underneath.
+_RESULT_CACHE: "OrderedDict[Tuple[str, Tuple[str, str, Optional[str]]], Tuple[float, SelectorTestResult]]" = OrderedDict()
+_RESULT_CACHE_MAX = 1024
+_RESULT_TTL = 60.0
+_RESULT_LOCK = threading.Lock()
+
+
+def _spec_of(sel_config: Dict[str, Any]) -> Tuple[str, str, Optional[str]]:
+    return sel_config.get('selector'), sel_config.get('extract_type', 'text'), sel_config.get('attribute_name')
+
+
+def _cached_results(url: str, selectors_config: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Split configs into (results still fresh in the cache, configs that need the page); results keep config order."""
+    results, missing, now = {}, [], time.monotonic()
+    with _RESULT_LOCK:
+        for sel_config in selectors_config:
+            name = sel_config.get('name', 'UnnamedSelector')
+            hit = _RESULT_CACHE.get((url, _spec_of(sel_config)))
+            if hit is not None and hit[0] > now:
+                results[name] = replace(hit[1], sample_values=list(hit[1].sample_values))
+            else:
+                results[name] = None  # Filled in by the caller once the page is evaluated
+                missing.append(sel_config)
+    return results, missing
+
+
+def _store_results(url: str, selectors_config: List[Dict[str, Any]], results: Dict[str, Any]):
+    expires = time.monotonic() + _RESULT_TTL
+    with _RESULT_LOCK:
+        for sel_config in selectors_config:
+            result = results.get(sel_config.get('name', 'UnnamedSelector'))
+            if not sel_config.get('selector') or result is None: continue
+            key = (url, _spec_of(sel_config))
+            _RESULT_CACHE[key] = (expires, replace(result, sample_values=list(result.sample_values)))
+            _RESULT_CACHE.move_to_end(key)
+        while len(_RESULT_CACHE) > _RESULT_CACHE_MAX: _RESULT_CACHE.popitem(last=False)
+
+
+# CSS selector -> compiled XPaths, or the error translating it raised. Module-level so it outlives bridge
+# instances; invalid selectors are cached too, so re-testing them doesn't re-run the translator.
+_CSS_CACHE: Dict[str, Union[Tuple[etree.XPath, etree.XPath], Exception]] = {}
+_CSS_CACHE_MAX = 4096
+_CSS_LOCK = threading.Lock()
+
+
+def _compile_css(selector: str) -> Tuple[etree.XPath, etree.XPath]:
+    """
+    CSS selector -> compiled (match count, first five matches) XPaths; retesting skips translation entirely.
+
+    Counting inside libxml2 means a selector matching thousands of nodes never builds a Python proxy per node.
+    """
+    compiled = _CSS_CACHE.get(selector)
+    if compiled is None:
+        try:
+            xpath = GenericTranslator().css_to_xpath(selector)
+            compiled = (etree.XPath(f"count({xpath})"), etree.XPath(f"({xpath})[position() <= 5]"))
+        except (SelectorError, etree.XPathError) as e:
+            compiled = e
+        with _CSS_LOCK:
+            if len(_CSS_CACHE) >= _CSS_CACHE_MAX: _CSS_CACHE.pop(next(iter(_CSS_CACHE)), None)  # Oldest first
+            _CSS_CACHE[selector] = compiled
+    if isinstance(compiled, Exception): raise compiled.with_traceback(None)
+    return compiled
+
+
+def _parse_lxml(body: bytes, charset: Optional[str] = None):
+    """lxml tree for a page, or None when libxml2 rejects it (callers then fall back to BeautifulSoup).
+    Parsed exactly like _fetch_page's streamed parse, so a page decodes the same on every test path."""
+    parser = lxml_html.HTMLParser(encoding=charset)
+    try:
+        parser.feed(body)
+        return parser.close()
+    except (etree.LxmlError, ValueError):
+        return None
+
+
+def _header_charset(content_type: str) -> Optional[str]:
+    """Charset declared in a Content-Type header, or None; one cheap header parse instead of sniffing the body."""
+    msg = Message()
+    msg['content-type'] = content_type
+    charset = msg.get_content_charset()
+    try:
+        return codecs.lookup(charset).name if charset else None
+    except LookupError:  # Bogus charset label: better to let the parser sniff than to fail
+        return None
+
+
+def _read_file_url(url: str) -> bytes:
+    """Bytes of a file:// page (a saved page opened from the URL bar); requests has no adapter for the scheme."""
+    return Path(url2pathname(urlsplit(url).path)).read_bytes()
+
+
+class _BS4Page:
+    """Slow path for pages lxml rejects; bs4 is only imported once one actually turns up."""
+
+    def __init__(self, body: str):  # Already decoded, so bs4 skips its own encoding detection
+        from bs4 import BeautifulSoup
+        self.soup = BeautifulSoup(body, 'html.parser')
+
+    def probe(self, selector: str):  # -> (match count, first five matches), like the lxml path
+        elements = self.soup.select(selector)
+        return len(elements), elements[:5]
+
+
+_SLOW_PATH_URLS = set()  # URLs already reported as needing the BeautifulSoup fallback
+
+
+def _warn_slow_path(logger: logging.Logger, url: str, reason: str):
+    """Warn once per URL per process that a page forced the BeautifulSoup slow path; repeats go to debug."""
+    log = logger.debug if url in _SLOW_PATH_URLS else logger.warning
+    _SLOW_PATH_URLS.add(url)
+    log(f"lxml could not parse {url} ({reason}); using the slower BeautifulSoup fallback.")
+
+
+# Text samples are cut to 151 chars inside libxml2 (one past the display limit, so truncation stays detectable)
+# instead of building a multi-KB Python string per element just to slice it.
+_TEXT_SAMPLE = etree.XPath("substring(normalize-space(.), 1, 151)")
+
+
+def _make_extractor(extract_type: str, attribute_name: Optional[str], for_lxml: bool = True) -> Callable[[Any], Any]:
+    """Pick the extraction branch once per selector instead of re-deciding it for every matched element."""
+    if extract_type == "attribute" and attribute_name:
+        if for_lxml: return lambda el: el.get(attribute_name)
+
+        def _bs4_attr(el):
+            value = el.get(attribute_name)
+            return " ".join(value) if isinstance(value, list) else value  # Some attributes return a list
+        return _bs4_attr
+    if extract_type == "html":
+        return (lambda el: etree.tostring(el, encoding='unicode', with_tail=False)) if for_lxml else str
+    # "text" and unknown types
+    return _TEXT_SAMPLE if for_lxml else (lambda el: el.get_text(strip=True))
 
 
 # Add existing scraper modules to path if this script can be run standalone
@@ -32,14 +202,38 @@ class RAGStudioBridge:
     """Bridge between GUI and scraping backend"""
 
     def __init__(self):
-        # It's better if the main application passes a logger instance.
-        # If this bridge is instantiated by the GUI, the GUI's logger can be passed.
-        self.logger = logging.getLogger("RAGStudioBridge")
-        if not self.logger.handlers:
-            # Fallback basic setup if no logger is configured by the caller
-            self.logger = setup_logger("RAGStudioBridge", log_file="rag_studio_bridge.log")
+        # No handler setup here: records propagate to whatever the app configured; see enable_file_logging().
+        self.logger = _logger
+        # One pooled session for selector tests: repeated tests against a host reuse its TCP/TLS connection.
+        self._http = requests.Session()
+        self._http.headers.update({'User-Agent': 'RAGDataStudio-SelectorTester/1.0'})
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        self._http.mount("http://", adapter)
+        self._http.mount("https://", adapter)
         self.logger.info("RAGStudioBridge initialized.")
 
+    def enable_file_logging(self, path: str = "rag_studio_bridge.log"):
+        """Also write the bridge's log to a file; the studio calls this wherever it creates a bridge. Idempotent."""
+        if any(isinstance(h, logging.FileHandler) for h in self.logger.handlers): return
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s (%(filename)s:%(lineno)d)"))
+        self.logger.addHandler(handler)
+        self.logger.setLevel(logging.DEBUG)
+
+    def invalidate_cache(self, url: Optional[str] = None):
+        """Forget cached selector results (and the cached page) for url, or for every page when url is None."""
+        with _RESULT_LOCK:
+            for key in [k for k in _RESULT_CACHE if url is None or k[0] == url]: del _RESULT_CACHE[key]
+        with _PAGE_CACHE_LOCK:
+            if url is None: _PAGE_CACHE.clear()
+            else: _PAGE_CACHE.pop(url, None)
+
+    def close(self):
+        """Release pooled HTTP connections; call on application shutdown."""
+        self._http.close()
+
     def run_scraping_pipeline_with_config_data(
             self,
             project_config_data: Dict[str, Any],
@@ -55,39 +249,129 @@ class RAGStudioBridge:
         Returns:
             List of enriched items from scraping pipeline.
         """
-        temp_config_path = None
         try:
-            # Create temporary YAML config file from the dictionary
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False, encoding='utf-8') as temp_file:
-                yaml.dump(project_config_data, temp_file, default_flow_style=False, indent=2, allow_unicode=True)
-                temp_config_path = temp_file.name
+            # Hand the dict straight to the pipeline; no temporary YAML file to write, re-read and clean up.
+            config_name = (project_config_data.get("domain_info") or {}).get("name", "GUI project")
+            self.logger.info(f"Running scraping pipeline with in-memory config: {config_name}")
 
-            self.logger.info(f"Running scraping pipeline with temporary config: {temp_config_path}")
-
-            # Use existing search_and_fetch function (which calls run_professional_pipeline)
-            # Pass the GUI's progress callback directly to search_and_fetch
-            enriched_items, _ = run_professional_pipeline(  # search_and_fetch returns (items, metrics)
-                query_or_config_path=temp_config_path,
+            # Pass the GUI's progress callback directly to the pipeline
+            enriched_items, _ = run_professional_pipeline(  # Returns (items, metrics)
+                query_or_config_path=config_name,
                 logger_instance=self.logger,  # Pass the bridge's logger or a dedicated pipeline logger
-                progress_callback=progress_callback_gui  # Pass the GUI's callback
+                progress_callback=progress_callback_gui,  # Pass the GUI's callback
+                config_data=project_config_data
             )
 
-            self.logger.info(f"Scraping pipeline completed. Processed {len(enriched_items)} items using temp config.")
+            self.logger.info(f"Scraping pipeline completed. Processed {len(enriched_items)} items.")
             return enriched_items
 
         except Exception as e:
             self.logger.error(f"Error running scraping pipeline with config data: {e}", exc_info=True)
             return []
-        finally:
-            if temp_config_path and os.path.exists(temp_config_path):
-                try:
-                    os.unlink(temp_config_path)
-                    self.logger.debug(f"Cleaned up temporary config file: {temp_config_path}")
-                except Exception as e_unlink:
-                    self.logger.warning(f"Could not delete temp config file {temp_config_path}: {e_unlink}")
 
     # _progress_callback is removed as we pass the GUI's callback directly.
 
+    def _fetch_page(self, url: str) -> Tuple[Optional[str], Any]:
+        """
+        GET url, revalidating any cached copy, and return (body, tree).
+
+        The body is streamed straight into lxml, so normally only the tree is kept and body is None.
+        If lxml rejects the page the body is refetched buffered and returned with tree None.
+        """
+        with _PAGE_CACHE_LOCK: cached = _PAGE_CACHE.get(url)
+        headers = {}
+        if cached:
+            if cached[0]: headers['If-None-Match'] = cached[0]
+            if cached[1]: headers['If-Modified-Since'] = cached[1]
+        with self._http.get(url, timeout=(5, 15), headers=headers, stream=True) as response:  # (connect, read)
+            if cached and response.status_code == 304:
+                with _PAGE_CACHE_LOCK:
+                    if url in _PAGE_CACHE: _PAGE_CACHE.move_to_end(url)
+                return cached[2], cached[3]
+            response.raise_for_status()
+            # Only trust an explicit header charset; otherwise let libxml2 sniff the <meta> tag.
+            charset = _header_charset(response.headers.get('Content-Type', ''))
+            parser = lxml_html.HTMLParser(encoding=charset)
+            body, size = None, 0
+            try:
+                for chunk in response.iter_content(65536):  # Already gzip-decoded; a 304 skips this entirely
+                    size += len(chunk)
+                    parser.feed(chunk)
+                tree = parser.close()
+            except etree.LxmlError as e_parse:
+                _warn_slow_path(self.logger, url, str(e_parse))
+                tree = None
+        if tree is None:
+            fallback = self._http.get(url, timeout=(5, 15))
+            fallback.raise_for_status()
+            fallback.encoding = charset or 'utf-8'  # Decide once here; never let requests or bs4 guess
+            body = fallback.text
+            size = len(body)
+        etag, last_modified = response.headers.get('ETag', ''), response.headers.get('Last-Modified', '')
+        # Without validators the page can't be revalidated, so don't keep it; nor a single page bigger than the cap.
+        if (etag or last_modified) and size <= _PAGE_CACHE_MAX_BYTES:
+            with _PAGE_CACHE_LOCK:
+                _PAGE_CACHE[url] = (etag, last_modified, body, tree, size)
+                _PAGE_CACHE.move_to_end(url)
+                total = sum(entry[4] for entry in _PAGE_CACHE.values())
+                while total > _PAGE_CACHE_MAX_BYTES: total -= _PAGE_CACHE.popitem(last=False)[1][4]
+        return body, tree
+
+    def _evaluate_selectors(self, url: str, body: Optional[str], tree, selectors_config: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run every selector against one page; tree is its lxml parse, or None to fall back to BeautifulSoup."""
+        for_lxml = tree is not None
+        if for_lxml:
+            def probe(sel):  # -> (match count, first five matches)
+                count_xp, sample_xp = _compile_css(sel)
+                return int(count_xp(tree)), sample_xp(tree)
+        else:
+            probe = _BS4Page(body).probe
+        _trunc = lambda v: v[:150] + '...' if len(v) > 150 else v
+        results = {}
+
+        # Decode each config once up front and group aliases: identical (selector, extract_type, attribute_name)
+        # specs are evaluated once and the result fanned back out to every name that uses them.
+        plans: Dict[Tuple[str, str, Optional[str]], List[str]] = {}
+        for sel_config in selectors_config:
+            name = sel_config.get('name', 'UnnamedSelector')
+            selector_str = sel_config.get('selector')
+            if not selector_str:
+                results[name] = SelectorTestResult(error='Selector string is empty.')
+                continue
+            results[name] = None  # Reserve the slot so results keep the config order
+            spec = (selector_str, sel_config.get('extract_type', 'text'), sel_config.get('attribute_name'))
+            plans.setdefault(spec, []).append(name)
+
+        for (selector_str, extract_type, attribute_name), names in plans.items():
+            extract = _make_extractor(extract_type, attribute_name, for_lxml)
+            current_result = SelectorTestResult()
+            try:
+                found_count, samples = probe(selector_str)
+                current_result.found_count = found_count
+
+                if found_count:
+                    current_result.success = True
+                    current_result.sample_values = [_trunc(str(value)) for value in map(extract, samples)
+                                                       if value is not None]  # Sample first 5 matches
+                else:
+                    current_result.error = "No elements found matching selector."
+
+            except Exception as e_select:
+                self.logger.warning(f"Error testing selector '{names[0]}' ({selector_str}) on {url}: {e_select}")
+                current_result.error = str(e_select)
+
+            results[names[0]] = current_result
+            for alias in names[1:]: results[alias] = replace(current_result, sample_values=list(current_result.sample_values))
+        return results
+
+    def _evaluate_page(self, url: str, body: bytes, charset: Optional[str],
+                       selectors_config: List[Dict[str, Any]]) -> Dict[str, Any]:
+        tree = _parse_lxml(body, charset)
+        if tree is None:
+            _warn_slow_path(self.logger, url, "parser error")
+            return self._evaluate_selectors(url, body.decode(charset or 'utf-8', errors='replace'), None, selectors_config)
+        return self._evaluate_selectors(url, None, tree, selectors_config)
+
     def test_selectors_on_url(self, url: str, selectors_config: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
         Test scraping rules (selectors) against a specific URL.
@@ -99,153 +383,158 @@ class RAGStudioBridge:
                               'extract_type', 'attribute_name'.
 
         Returns:
-            Test results for each selector:
-            {
-                'selector_name_1': {
-                    'success': bool,
-                    'found_count': int,
-                    'sample_values': List[str],
-                    'error': Optional[str]
-                }, ...
-            }
+            A SelectorTestResult (success, found_count, sample_values, error) per selector name:
+            {'selector_name_1': SelectorTestResult(...), ...}
+            or {'error': str} if the page could not be fetched.
         """
-        results = {}
         if not url or not selectors_config:
             self.logger.warning("Test selectors: URL or selectors config is empty.")
             return {"error": "URL or selector definitions cannot be empty."}
 
         try:
-            import requests  # Keep requests import local to this method if only used here
-            from bs4 import BeautifulSoup
-
             self.logger.info(f"Testing {len(selectors_config)} selectors on URL: {url}")
-            response = requests.get(url, timeout=15, headers={'User-Agent': 'RAGDataStudio-SelectorTester/1.0'})
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            for sel_config in selectors_config:
-                name = sel_config.get('name', 'UnnamedSelector')
-                selector_str = sel_config.get('selector')
-                extract_type = sel_config.get('extract_type', 'text')  # Default to 'text'
-                attribute_name = sel_config.get('attribute_name')  # For 'attribute' type
-                # is_list = sel_config.get('is_list', False) # For future use if needed
-
-                if not selector_str:
-                    results[name] = {'success': False, 'found_count': 0, 'sample_values': [],
-                                     'error': 'Selector string is empty.'}
-                    continue
-
-                current_result = {'success': False, 'found_count': 0, 'sample_values': [], 'error': None}
-                try:
-                    elements = soup.select(selector_str)
-                    current_result['found_count'] = len(elements)
-
-                    if elements:
-                        current_result['success'] = True
-                        sample_values = []
-                        for elem in elements[:5]:  # Sample first 5 matches
-                            value = None
-                            if extract_type == "text":
-                                value = elem.get_text(strip=True)
-                            elif extract_type == "attribute" and attribute_name:
-                                value = elem.get(attribute_name)
-                                if isinstance(value, list):  # Some attributes return a list
-                                    value = " ".join(value)
-                            elif extract_type == "html":
-                                value = str(elem)
-                            else:  # Fallback or if extract_type is unknown
-                                value = elem.get_text(strip=True)
-
-                            if value is not None:  # Ensure value is not None before converting to str
-                                value_str = str(value)
-                                sample_values.append(value_str[:150] + '...' if len(value_str) > 150 else value_str)
-
-                        current_result['sample_values'] = sample_values
-                    else:
-                        current_result['error'] = "No elements found matching selector."
-
-                except Exception as e_select:
-                    self.logger.warning(f"Error testing selector '{name}' ({selector_str}) on {url}: {e_select}")
-                    current_result['error'] = str(e_select)
-
-                results[name] = current_result
+            results, missing = _cached_results(url, selectors_config)
+            if missing:  # Only selectors without a fresh cached result need the page
+                if url.startswith('file:'):
+                    fresh = self._evaluate_page(url, _read_file_url(url), None, missing)
+                else:
+                    # Parsed once with libxml2; BeautifulSoup is only the fallback for pages lxml rejects.
+                    body, tree = self._fetch_page(url)
+                    fresh = self._evaluate_selectors(url, body, tree, missing)
+                _store_results(url, missing, fresh)
+                results.update(fresh)
 
             self.logger.info(f"Selector testing completed for {url}. Results: {len(results)} selectors tested.")
 
         except requests.exceptions.RequestException as e_req:
             self.logger.error(f"Request failed for URL {url} during selector testing: {e_req}")
             return {"error": f"Failed to fetch URL: {e_req}"}
+        except OSError as e_io:  # After RequestException, which subclasses it
+            self.logger.error(f"Could not read {url} during selector testing: {e_io}")
+            return {"error": f"Failed to read file: {e_io}"}
         except Exception as e_general:
             self.logger.error(f"General error during selector testing for {url}: {e_general}", exc_info=True)
             return {"error": f"An unexpected error occurred: {e_general}"}
 
         return results
 
-    # validate_rag_output and _generate_recommendations are removed.
+    async def test_selectors_on_urls_async(self, urls: List[str], selectors_config: List[Dict[str, Any]],
+                                           concurrency: int = 16) -> Dict[str, Dict[str, Any]]:
+        """
+        Test the same selectors against several URLs, fetching them concurrently.
 
+        Pages are downloaded with aiohttp (at most `concurrency` in flight) and evaluated on the
+        default thread pool, where lxml releases the GIL. Returns {url: test_selectors_on_url-style results}.
+        Needs a real asyncio loop (e.g. asyncio.run on a worker thread): QtAsyncio's loop implements no
+        socket or DNS primitives, so GUI code uses test_selectors_on_urls on an executor instead.
+        """
+        if not urls or not selectors_config:
+            self.logger.warning("Test selectors: URLs or selectors config is empty.")
+            return {"error": "URL or selector definitions cannot be empty."}
 
-class TestResultsDialog(QDialog):
-    """Dialog to show selector testing results"""
+        urls = list(dict.fromkeys(urls))  # Each distinct URL is fetched once
+        split = {url: _cached_results(url, selectors_config) for url in urls}
+        fetch_urls = [url for url in urls if split[url][1]]  # Pages with every result cached aren't fetched at all
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit=32, limit_per_host=8, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=15),
+                                         headers={'User-Agent': self._http.headers['User-Agent']}) as session:
+            async def _fetch(url: str) -> Tuple[bytes, Optional[str]]:
+                if url.startswith('file:'):
+                    return await loop.run_in_executor(None, _read_file_url, url), None
+                async with sem, session.get(url) as response:
+                    response.raise_for_status()
+                    # Same header-only, normalized charset as _fetch_page; None lets libxml2 sniff the <meta> tag
+                    return await response.read(), _header_charset(response.headers.get('Content-Type', ''))
+
+            bodies = dict(zip(fetch_urls, await asyncio.gather(*(_fetch(u) for u in fetch_urls), return_exceptions=True)))
+
+        # Evaluation of all pages runs in parallel on the executor; await in URL order.
+        pending = {url: loop.run_in_executor(None, self._evaluate_page, url, *body, split[url][1])
+                   for url, body in bodies.items() if not isinstance(body, BaseException)}
+        results = {}
+        for url in urls:
+            cached, missing = split[url]
+            if not missing:
+                results[url] = cached
+                continue
+            body = bodies[url]
+            if isinstance(body, BaseException):
+                self.logger.error(f"Request failed for URL {url} during selector testing: {body}")
+                results[url] = {"error": f"Failed to fetch URL: {body}"}
+                continue
+            try:
+                fresh = await pending[url]
+                _store_results(url, missing, fresh)
+                cached.update(fresh)
+                results[url] = cached
+            except Exception as e_general:
+                self.logger.error(f"General error during selector testing for {url}: {e_general}", exc_info=True)
+                results[url] = {"error": f"An unexpected error occurred: {e_general}"}
+        return results
 
-    def __init__(self, results: Dict[str, Any], parent=None, test_url="N/A"):
-        super().__init__(parent)
-        self.setWindowTitle(f"Selector Test Results for: {test_url}")
-        self.setModal(True)
-        self.resize(800, 600)
+    async def test_selectors_on_url_async(self, url: str, selectors_config: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Awaitable test_selectors_on_url for callers already running a real asyncio loop (not QtAsyncio's)."""
+        results = await self.test_selectors_on_urls_async([url], selectors_config)
+        return results.get(url, results)  # Falls through to the {'error': ...} dict for empty input
 
-        layout = QVBoxLayout(self)
+    def test_selectors_on_urls(self, urls: List[str], selectors_config: List[Dict[str, Any]],
+                               max_workers: int = 8) -> Dict[str, Dict[str, Any]]:
+        """
+        Blocking multi-URL variant of test_selectors_on_url for callers without an event loop.
 
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)  # Name, Status, Count, Samples
-        self.results_table.setHorizontalHeaderLabels([
-            "Rule Name", "Status", "Found Count", "Sample Values (up to 5)"
-        ])
-        self.results_table.setAlternatingRowColors(True)
-        self.results_table.setWordWrap(True)  # Allow text wrapping in cells
+        Runs on a thread pool sharing the bridge's pooled session (and page cache); socket reads and
+        lxml parsing release the GIL, so the fetches overlap. Results are keyed by URL, in input order.
+        """
+        unique_urls = list(dict.fromkeys(urls))
+        # Beyond the adapter's pool_maxsize (16), extra workers would only wait for a connection
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, 16, len(unique_urls)))) as ex:
+            futures = {url: ex.submit(self.test_selectors_on_url, url, selectors_config) for url in unique_urls}
+            results = {}
+            for url, future in futures.items():
+                try:
+                    results[url] = future.result()
+                except Exception as e_general:  # test_selectors_on_url reports its own errors; this is a backstop
+                    self.logger.error(f"General error during selector testing for {url}: {e_general}", exc_info=True)
+                    results[url] = {"error": f"An unexpected error occurred: {e_general}"}
+        return results
 
-        if "error" in results:  # Handle global error like URL fetch failure
-            self.results_table.setRowCount(1)
-            self.results_table.setItem(0, 0, QTableWidgetItem("Error"))
-            error_item = QTableWidgetItem(results["error"])
-            self.results_table.setItem(0, 1, error_item)
-            self.results_table.setSpan(0, 1, 1, 3)  # Span error message across other columns
-        else:
-            self.results_table.setRowCount(len(results))
-            for row, (name, result_data) in enumerate(results.items()):
-                self.results_table.setItem(row, 0, QTableWidgetItem(name))
+    # validate_rag_output and _generate_recommendations are removed.
 
-                status_text = "✅ Success" if result_data.get('success') else "❌ Failed"
-                if result_data.get('error'):
-                    status_text += f" ({result_data.get('error')})"
 
-                status_item = QTableWidgetItem(status_text)
-                if result_data.get('success'):
-                    status_item.setBackground(QColor(200, 255, 200))  # Light green
-                else:
-                    status_item.setBackground(QColor(255, 200, 200))  # Light red
-                self.results_table.setItem(row, 1, status_item)
+class _SelectorTestSignals(QObject):
+    finished = Signal(dict)
 
-                self.results_table.setItem(row, 2, QTableWidgetItem(str(result_data.get('found_count', 0))))
 
-                sample_text = "\n---\n".join(result_data.get('sample_values', []))
-                if not sample_text and not result_data.get('success') and not result_data.get('error'):
-                    sample_text = "No elements found."
-                elif not sample_text and result_data.get('error'):
-                    sample_text = "Error during extraction."
+class SelectorTestWorker(QRunnable):
+    """Runs RAGStudioBridge.test_selectors_on_url (or test_selectors_on_urls, for a list of URLs) on a pool thread
+    so the GUI keeps painting meanwhile."""
 
-                self.results_table.setItem(row, 3, QTableWidgetItem(sample_text))
+    def __init__(self, bridge: RAGStudioBridge, url: Union[str, List[str]], selectors_config: List[Dict[str, Any]]):
+        super().__init__()
+        self.bridge = bridge
+        self.url = url
+        self.selectors_config = selectors_config
+        self.signals = _SelectorTestSignals()
 
-        self.results_table.resizeColumnsToContents()
-        self.results_table.resizeRowsToContents()
-        # Set horizontal header to stretch last section
-        self.results_table.horizontalHeader().setStretchLastSection(True)
+    def run(self):
+        try:
+            test = self.bridge.test_selectors_on_url if isinstance(self.url, str) else self.bridge.test_selectors_on_urls
+            results = test(self.url, self.selectors_config)
+        except Exception as e:  # Never let an exception die silently on a pool thread
+            results = {"error": f"An unexpected error occurred: {e}"}
+        self.signals.finished.emit(results)
 
-        close_btn = QPushButton("Close")
-        close_btn.clicked.connect(self.accept)
 
-        layout.addWidget(QLabel(f"Test Results for URL: {test_url}"))
-        layout.addWidget(self.results_table)
-        layout.addWidget(close_btn)
+def test_selectors_async(bridge: RAGStudioBridge, url: Union[str, List[str]], selectors_config: List[Dict[str, Any]],
+                         on_done: Callable[[Dict[str, Any]], None]) -> SelectorTestWorker:
+    """Test selectors on the global QThreadPool; on_done receives the results dict on the GUI thread
+    (keyed by URL when url is a list)."""
+    worker = SelectorTestWorker(bridge, url, selectors_config)
+    worker.signals.finished.connect(on_done)
+    QThreadPool.globalInstance().start(worker)
+    return worker
 
 
 # RAGValidationDialog is removed.
@@ -317,15 +606,23 @@ if __name__ == "__main__":
 
     test_sel_results = bridge.test_selectors_on_url(test_url_for_selectors, selectors_to_test)
     print("Selector Test Results (raw dict):")
-    import json
+    try:
+        import orjson  # Serializes the slots dataclasses natively
+
+        _dumps = lambda o: orjson.dumps(o, option=orjson.OPT_INDENT_2).decode()
+    except ImportError:
+        import json
+
+        _dumps = lambda o: json.dumps(o, indent=2, default=lambda v: v.to_dict() if isinstance(v, SelectorTestResult) else str(v))
 
-    print(json.dumps(test_sel_results, indent=2))
+    print(_dumps(test_sel_results))
 
     # To show the dialog (requires a QApplication instance)
     # This part won't run well without a full Qt app loop, but shows instantiation.
     # if __name__ == '__main__' and 'QApplication' not in sys.modules: # Check if running in a Qt context
     # try:
     #     from PySide6.QtWidgets import QApplication
+    #     from rag_data_studio.components.dialogs import TestResultsDialog
     #     app_instance = QApplication.instance() or QApplication(sys.argv)
 
     #     dialog = TestResultsDialog(test_sel_results, test_url=test_url_for_selectors)
@@ -339,4 +636,5 @@ if __name__ == "__main__":
     # except RuntimeError as e:
     #     print(f"Could not create QApplication for dialog test: {e}")
 
+    bridge.close()
     print("\nBridge testing finished.")
\ No newline at end of file
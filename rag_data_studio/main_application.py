@@ -4,18 +4,61 @@ RAG Data Studio - Clean & Simple Visual Scraper Builder
 Apple-style simplicity, wired to your backend scraper
 """
 
+import re
 import sys
 import json
+import asyncio
 import uuid
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterable, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
 
-from PySide6.QtWidgets import *
-from PySide6.QtCore import *
-from PySide6.QtGui import *
+from PySide6.QtWidgets import (
+    QAbstractItemView, QApplication, QCheckBox, QComboBox, QDialog, QFileDialog, QFormLayout, QGroupBox,
+    QHBoxLayout, QLabel, QLineEdit, QListWidget, QListWidgetItem, QMainWindow, QMessageBox, QPushButton,
+    QSplitter, QStatusBar, QTableView, QTextEdit, QVBoxLayout, QWidget
+)
+from PySide6.QtCore import QFile, QIODevice, QObject, QRunnable, QThread, QThreadPool, QTimer, QUrl, Qt, Signal, Slot
+from PySide6.QtGui import QFont, QKeySequence, QShortcut, QStandardItem, QStandardItemModel
 from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineScript, QWebEngineSettings
+from PySide6.QtWebChannel import QWebChannel
+
+try:
+    from PySide6 import QtAsyncio  # PySide6 >= 6.6: asyncio runs on the Qt event loop
+except ImportError:
+    QtAsyncio = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+_HTML_SUFFIXES = frozenset({'.html', '.htm'})
+_NAME_MARKERS_RE = re.compile(r"\. | jr| sr| iii")
+_DETECT_MAX_LEN = 64  # Longer element texts are paragraphs/containers, never a single name, rank or score
+# Content heuristics for the targeter, tried in order on the lower-cased text:
+# (matcher, selector must contain one of (or None), detected type, (selector key, field if key present, field otherwise))
+_CONTENT_RULES = (
+    (_NAME_MARKERS_RE.search, None, 'person_name', ('rank', 'player_name', 'person_name')),
+    # Two or more words of letters and dots only
+    (re.compile(r"(?=.* )(?=.*[^\W\d_])(?:[^\W\d_]|[. ])+").fullmatch, None, 'person_name',
+     ('rank', 'player_name', 'person_name')),
+    # A whole number up to 1000, in at most four digits
+    (re.compile(r"\d{1,3}|0\d{3}|1000").fullmatch, ('rank', 'position'), 'ranking',
+     (None, None, 'ranking_position')),
+    # Three or more characters of digits with ',' / '.' separators
+    (re.compile(r"(?=.{3})[.,]*\d[\d.,]*").fullmatch, None, 'score', ('point', 'points', 'score')),
+)
+_EXTRACTIONS = ("text", "attribute", "html")
+_DOMAINS = ("sports", "finance", "legal", "medical", "e-commerce",
+            "real-estate", "news", "research", "education", "technology")
+_KS_NEW = QKeySequence.StandardKey.New
+_KS_QUIT = QKeySequence.StandardKey.Quit
+# JS world for our injected scripts: same DOM as the page, but isolated from its globals
+_TARGETING_WORLD = int(QWebEngineScript.ScriptWorldId.ApplicationWorld)
 
 # Dark Theme Stylesheet
 DARK_THEME = """
@@ -69,6 +112,16 @@ QPushButton[class="success"]:hover {
     background-color: #45a049;
 }
 
+QPushButton[class="targetBtn"] {
+    background-color: #4CAF50;
+    border-color: #45a049;
+}
+
+QPushButton[class="targetBtn"]:checked {
+    background-color: #404040;
+    border-color: #606060;
+}
+
 QLineEdit, QTextEdit, QPlainTextEdit {
     background-color: #3a3a3a;
     border: 2px solid #555555;
@@ -108,7 +161,7 @@ QComboBox QAbstractItemView {
     color: white;
 }
 
-QTableWidget {
+QTableView {
     background-color: #2a2a2a;
     alternate-background-color: #343434;
     gridline-color: #555555;
@@ -116,7 +169,7 @@ QTableWidget {
     border-radius: 6px;
 }
 
-QTableWidget::item:selected {
+QTableView::item:selected {
     background-color: #4CAF50;
     color: white;
 }
@@ -165,8 +218,26 @@ QSplitter::handle {
 }
 """
 
+HEADER_STYLE = "color: #4CAF50; margin: 10px 0;"
+_HEADER_FONT = None
 
-@dataclass
+
+def _header_font() -> QFont:
+    """Shared panel header font; built on first use, once a QApplication exists"""
+    global _HEADER_FONT
+    if _HEADER_FONT is None:
+        _HEADER_FONT = QFont("Arial", 14, QFont.Bold)
+    return _HEADER_FONT
+
+
+def _make_header(text: str) -> QLabel:
+    header = QLabel(text)
+    header.setFont(_header_font())
+    header.setStyleSheet(HEADER_STYLE)
+    return header
+
+
+@dataclass(slots=True)
 class ScrapingRule:
     """Simple scraping rule - matches your backend exactly"""
     id: str
@@ -178,8 +249,34 @@ class ScrapingRule:
     is_list: bool = False
     required: bool = False
 
+    _backend_dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    _BACKEND_FIELDS = frozenset({"name", "selector", "extract_type", "attribute_name", "is_list", "required"})
+
+    def __setattr__(self, name, value):
+        if name in self._BACKEND_FIELDS:
+            object.__setattr__(self, "_backend_dict", None)
+        object.__setattr__(self, name, value)
+
+    def to_backend_dict(self) -> Dict[str, Any]:
+        """The custom_fields entry the backend expects; cached until one of its fields is reassigned"""
+        if self._backend_dict is None:
+            self._backend_dict = {
+                "name": self.name,
+                "selector": self.selector,
+                "extract_type": self.extract_type,
+                "attribute_name": self.attribute_name,
+                "is_list": self.is_list,
+                "required": self.required
+            }
+        return self._backend_dict
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "name": self.name, "description": self.description, "selector": self.selector,
+                "extract_type": self.extract_type, "attribute_name": self.attribute_name,
+                "is_list": self.is_list, "required": self.required}
 
-@dataclass
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Simple project configuration"""
     id: str
@@ -191,13 +288,70 @@ class ProjectConfig:
     created_at: str
     updated_at: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {"id": self.id, "name": self.name, "description": self.description, "domain": self.domain,
+                "target_websites": list(self.target_websites),
+                "scraping_rules": [rule.to_dict() for rule in self.scraping_rules],
+                "created_at": self.created_at, "updated_at": self.updated_at}
+
+
+def _find_first_list_field(enriched_items) -> Tuple[Optional[List[Dict[str, Any]]], str]:
+    """First custom field holding a list of records (a structured list rule), and its name; single pass"""
+    for item in enriched_items:
+        for field_name, field_value in item.custom_fields.items():
+            if isinstance(field_value, list) and field_value and isinstance(field_value[0], dict):
+                return field_value, field_name
+    return None, ""
+
+
+class ExtractionWorker(QObject):
+    """Runs the backend scraping pipeline off the GUI thread"""
+
+    progress = Signal(str, int)
+    finished = Signal(list, str)  # rows to display, list name
+    error = Signal(str)
+    cancelled = Signal()  # The user stopped the scrape; not an error
+
+    def __init__(self, project_data: Dict[str, Any]):
+        super().__init__()
+        self.project_data = project_data
+
+    def _on_progress(self, message: str, percentage: int):
+        # The pipeline has no cancel hook of its own; bail out at the next progress step instead
+        if QThread.currentThread().isInterruptionRequested():
+            raise InterruptedError("Extraction cancelled")
+        self.progress.emit(message, percentage)
+
+    def run(self):
+        try:
+            from rag_data_studio.integration.backend_bridge import RAGStudioBridge
+            bridge = RAGStudioBridge()
+            bridge.enable_file_logging()
+            try:
+                items = bridge.run_scraping_pipeline_with_config_data(self.project_data, self._on_progress)
+            finally:
+                bridge.close()
+            if QThread.currentThread().isInterruptionRequested():  # The bridge logs and swallows our InterruptedError
+                self.cancelled.emit()
+                return
+            records, list_name = _find_first_list_field(items)
+            if records is None:  # No structured list: one row of custom fields per page
+                records = [{"source_url": str(item.source_url), **item.custom_fields} for item in items]
+                list_name = self.project_data["domain_info"]["name"]
+            self.finished.emit(records, list_name)
+        except InterruptedError:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+
 
 class RuleEditDialog(QDialog):
     """Dialog for editing scraping rules"""
 
-    def __init__(self, rule: ScrapingRule, parent=None):
+    def __init__(self, rule: ScrapingRule, parent=None, taken_names: Iterable[str] = ()):
         super().__init__(parent)
         self.rule = rule
+        self.taken_names = frozenset(taken_names)  # Names of the project's other rules
         self.setWindowTitle(f"Edit Rule: {rule.name}")
         self.setModal(True)
         self.resize(500, 400)
@@ -215,7 +369,7 @@ class RuleEditDialog(QDialog):
         self.selector_input = QLineEdit()
 
         self.extract_type_combo = QComboBox()
-        self.extract_type_combo.addItems(["text", "attribute", "html"])
+        self.extract_type_combo.addItems(_EXTRACTIONS)
 
         self.attribute_input = QLineEdit()
         self.attribute_input.setPlaceholderText("e.g., href, src, data-value")
@@ -269,6 +423,10 @@ class RuleEditDialog(QDialog):
         if not self.name_input.text().strip():
             QMessageBox.warning(self, "Missing Name", "Please provide a rule name.")
             return
+        if self.name_input.text().strip() in self.taken_names:
+            QMessageBox.warning(self, "Duplicate Name",
+                                f"A rule named '{self.name_input.text().strip()}' already exists in this project.")
+            return
 
         self.rule.name = self.name_input.text().strip()
         self.rule.description = self.description_input.text().strip()
@@ -289,6 +447,7 @@ class VisualElementTargeter(QWidget):
     """Clean, simple element targeting - Apple-style"""
 
     rule_created = Signal(ScrapingRule)
+    test_selector_requested = Signal(dict)  # One bridge selector config for the current selection
 
     def __init__(self):
         super().__init__()
@@ -301,9 +460,7 @@ class VisualElementTargeter(QWidget):
         layout = QVBoxLayout(self)
 
         # Header
-        header = QLabel("🎯 Smart Element Targeting")
-        header.setFont(QFont("Arial", 14, QFont.Bold))
-        header.setStyleSheet("color: #4CAF50; margin: 10px 0;")
+        header = _make_header("🎯 Smart Element Targeting")
 
         # Current selection
         selection_group = QGroupBox("Current Selection")
@@ -313,9 +470,10 @@ class VisualElementTargeter(QWidget):
         self.selector_display.setReadOnly(True)
         self.selector_display.setPlaceholderText("Click an element in the browser...")
 
-        self.element_text_display = QTextEdit()
-        self.element_text_display.setReadOnly(True)
+        self.element_text_display = QLabel()
+        self.element_text_display.setWordWrap(True)
         self.element_text_display.setMaximumHeight(60)
+        self.element_text_display.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
         self.smart_suggestions = QLabel()
         self.smart_suggestions.setStyleSheet("color: #4CAF50; font-weight: bold; padding: 5px;")
@@ -358,7 +516,7 @@ class VisualElementTargeter(QWidget):
         options_layout = QFormLayout(options_group)
 
         self.extraction_type_combo = QComboBox()
-        self.extraction_type_combo.addItems(["text", "attribute", "html"])
+        self.extraction_type_combo.addItems(_EXTRACTIONS)
 
         self.attribute_input = QLineEdit()
         self.attribute_input.setPlaceholderText("e.g., href, src, data-value")
@@ -401,29 +559,17 @@ class VisualElementTargeter(QWidget):
 
     def detect_content_type(self, text: str, element_type: str, selector: str) -> dict:
         """Simple content detection"""
-        text = text.strip().lower()
-
-        # Name detection
-        if any(pattern in text for pattern in ['. ', ' jr', ' sr', ' iii']) or \
-                (len(text.split()) >= 2 and text.replace(' ', '').replace('.', '').isalpha()):
-            return {
-                'type': 'person_name',
-                'suggested_field': 'player_name' if 'rank' in selector else 'person_name'
-            }
+        text = text.strip()
+        if len(text) > _DETECT_MAX_LEN:
+            return {'type': 'text', 'suggested_field': 'data_field'}
+        text = text.lower()
 
-        # Ranking detection
-        if text.isdigit() and int(text) <= 1000 and ('rank' in selector or 'position' in selector):
-            return {
-                'type': 'ranking',
-                'suggested_field': 'ranking_position'
-            }
-
-        # Score/Points detection
-        if text.replace(',', '').replace('.', '').isdigit() and len(text) >= 3:
-            return {
-                'type': 'score',
-                'suggested_field': 'points' if 'point' in selector else 'score'
-            }
+        for match, selector_needs, content_type, (key, keyed_field, default_field) in _CONTENT_RULES:
+            if match(text) and (selector_needs is None or any(k in selector for k in selector_needs)):
+                return {
+                    'type': content_type,
+                    'suggested_field': keyed_field if key and key in selector else default_field
+                }
 
         # Default
         return {
@@ -495,7 +641,8 @@ class VisualElementTargeter(QWidget):
                 is_list=True
             )
 
-            self.rule_created.emit(rule)
+            if not self._add_rule(rule):
+                return
             QMessageBox.information(self, "Bulk Rule Created",
                                     f"Created structured list rule: {rule.name}")
 
@@ -518,6 +665,14 @@ class VisualElementTargeter(QWidget):
         """Enable/disable attribute field"""
         self.attribute_input.setEnabled(extraction_type == "attribute")
 
+    def _add_rule(self, rule: ScrapingRule) -> bool:
+        """Add rule to the window's project; False if the window rejected it"""
+        main_window = self.window()
+        if hasattr(main_window, 'add_rule_to_project') and not main_window.add_rule_to_project(rule):
+            return False
+        self.rule_created.emit(rule)
+        return True
+
     def save_current_rule(self):
         """Save current selection as scraping rule"""
         if not self.current_selector or not self.field_name_input.text():
@@ -536,7 +691,8 @@ class VisualElementTargeter(QWidget):
             required=self.required_check.isChecked()
         )
 
-        self.rule_created.emit(rule)
+        if not self._add_rule(rule):
+            return  # Rejected (the window said why); keep the form so the name can be fixed
 
         # Clear form
         self.field_name_input.clear()
@@ -551,203 +707,147 @@ class VisualElementTargeter(QWidget):
         QMessageBox.information(self, "Rule Saved", f"Saved: {rule.name}")
 
     def test_current_selector(self):
-        """Test current selector"""
+        """Ask the window to test the current selector against the loaded page"""
         if self.current_selector:
-            QMessageBox.information(self, "Test Results",
-                                    f"Testing: {self.current_selector}\n\n"
-                                    f"Sample text: {self.current_element_text[:100]}...")
-
-
-class InteractiveBrowser(QWebEngineView):
-    """Browser with smart element targeting"""
-
-    element_selected = Signal(str, str, str)
-
-    def __init__(self):
-        super().__init__()
-        self.targeting_widget = None
-        self.poll_timer = QTimer()
-        self.poll_timer.timeout.connect(self.check_selection)
-        self.is_targeting_active = False
-
-    def set_targeting_widget(self, widget):
-        self.targeting_widget = widget
-
-    def check_selection(self):
-        """Check if user selected an element"""
-        check_js = "window._ragSelection || null;"
+            self.test_btn.setEnabled(False)  # Re-enabled by the window once the results are in
+            self.test_selector_requested.emit({
+                "name": self.field_name_input.text() or f"test_{self.current_element_type}",
+                "selector": self.current_selector,
+                "extract_type": self.extraction_type_combo.currentText(),
+                "attribute_name": self.attribute_input.text() if self.attribute_input.isEnabled() else None
+            })
 
-        def handle_result(result):
-            if result:
-                try:
-                    data = json.loads(result) if isinstance(result, str) else result
-                    selector = data.get('selector', '')
-                    text = data.get('text', '')
-                    element_type = data.get('type', '')
 
-                    self.poll_timer.stop()
-                    self.page().runJavaScript("window._ragSelection = null;")
+class _SelectionBridge(QObject):
+    """Object exposed to page JS over QWebChannel; the page pushes clicks here"""
 
-                    self.element_selected.emit(selector, text, element_type)
-                    if self.targeting_widget:
-                        self.targeting_widget.update_selection(selector, text, element_type)
+    selected = Signal(str)
 
-                except (json.JSONDecodeError, TypeError) as e:
-                    print(f"🎯 Parse error: {e}")
+    @Slot(str)
+    def on_element_selected(self, payload):
+        self.selected.emit(payload)
 
-        self.page().runJavaScript(check_js, handle_result)
 
-    def enable_selector_mode(self):
-        """Enable element selection mode with proper cleanup"""
-        if self.is_targeting_active:
-            return  # Already active, don't double-inject
+class _ParseSignals(QObject):
+    parsed = Signal(dict)
 
-        self.is_targeting_active = True
 
-        js_code = """
-        // Clean up any existing targeting
-        if (window._ragTargetingCleanup) {
-            window._ragTargetingCleanup();
-        }
+class _ParseTask(QRunnable):
+    """Decodes a selection payload on the thread pool; element texts can be large, and parsing them stays off the GUI thread"""
 
-        console.log('🎯 Starting smart targeting mode');
-        window._ragSelection = null;
-
-        let isSelecting = true;
-        let highlighted = null;
-        let overlay = null;
-        let tooltip = null;
-
-        // Create overlay
-        overlay = document.createElement('div');
-        overlay.style.cssText = `
-            position: fixed; top: 0; left: 0; width: 100%; height: 100%;
-            background: rgba(76, 175, 80, 0.1); z-index: 999999;
-            pointer-events: none; border: 3px solid #4CAF50;
-        `;
-        document.body.appendChild(overlay);
-
-        // Create tooltip
-        tooltip = document.createElement('div');
-        tooltip.style.cssText = `
-            position: fixed; top: 20px; right: 20px;
-            background: #4CAF50; color: white; padding: 10px 15px;
-            border-radius: 6px; z-index: 1000000; font-family: Arial;
-            font-size: 14px; font-weight: bold;
-        `;
-        tooltip.textContent = '🎯 Click any element to create scraping rule';
-        document.body.appendChild(tooltip);
-
-        function highlight(element) {
-            if (highlighted) {
-                highlighted.style.outline = '';
-                highlighted.style.backgroundColor = '';
-            }
-            element.style.outline = '3px solid #FF5722';
-            element.style.backgroundColor = 'rgba(255, 87, 34, 0.1)';
-            highlighted = element;
-        }
+    def __init__(self, payload: str):
+        super().__init__()
+        self.payload = payload
+        self.signals = _ParseSignals()
+
+    def run(self):
+        try:
+            data = json.loads(self.payload)
+        except (json.JSONDecodeError, TypeError) as e:
+            print(f"🎯 Parse error: {e}")
+            return
+        if isinstance(data, dict):
+            self.signals.parsed.emit(data)  # Queued back to the browser on the GUI thread
 
-        function makeSmartSelector(element) {
-            if (element.id) {
-                return '#' + element.id;
-            }
 
-            let selector = element.tagName.toLowerCase();
+_BROWSER_PROFILE = None
 
-            // For table cells, include the row context
-            if (selector === 'td') {
-                let row = element.closest('tr');
-                if (row) {
-                    let cellIndex = Array.from(row.children).indexOf(element);
-                    selector = `tr td:nth-child(${cellIndex + 1})`;
-                }
-            }
 
-            // For list items
-            if (selector === 'li') {
-                let list = element.closest('ul, ol');
-                if (list) {
-                    selector = `${list.tagName.toLowerCase()} li`;
-                }
-            }
+def _browser_profile() -> QWebEngineProfile:
+    """Named (on-disk) profile: Qt 6's default profile is off-the-record, so it can only cache in memory"""
+    global _BROWSER_PROFILE
+    if _BROWSER_PROFILE is None:
+        _BROWSER_PROFILE = QWebEngineProfile("rag_data_studio", QApplication.instance())
+        _BROWSER_PROFILE.setHttpCacheType(QWebEngineProfile.DiskHttpCache)  # Reloads reuse downloaded assets
+    return _BROWSER_PROFILE
 
-            // Add specific classes if they exist
-            if (element.className && element.className.trim()) {
-                let classes = element.className.trim().split(/\\s+/)
-                    .filter(cls => !['active', 'selected', 'hover', 'focus'].includes(cls))
-                    .slice(0, 2);
-                if (classes.length > 0) {
-                    selector += '.' + classes.join('.');
-                }
-            }
 
-            return selector;
-        }
+class InteractiveBrowser(QWebEngineView):
+    """Browser with smart element targeting"""
 
-        // Event handlers
-        function handleMouseOver(e) {
-            if (isSelecting) {
-                e.preventDefault();
-                e.stopPropagation();
-                highlight(e.target);
-            }
-        }
+    element_selected = Signal(str, str, str)
 
-        function handleClick(e) {
-            if (isSelecting) {
-                e.preventDefault();
-                e.stopPropagation();
+    # Features the targeting workflow never needs, and what to set them to
+    _SETTINGS = (
+        (QWebEngineSettings.WebGLEnabled, False),
+        (QWebEngineSettings.PluginsEnabled, False),
+        (QWebEngineSettings.Accelerated2dCanvasEnabled, False),
+        (QWebEngineSettings.AutoLoadIconsForPage, False),
+        (QWebEngineSettings.ScrollAnimatorEnabled, False),
+        (QWebEngineSettings.PlaybackRequiresUserGesture, True),
+    )
 
-                let selector = makeSmartSelector(e.target);
-                let text = e.target.textContent.trim();
-                let elementType = e.target.tagName.toLowerCase();
+    def __init__(self):
+        super().__init__()
+        self.targeting_widget = None
+        self.is_targeting_active = False
 
-                window._ragSelection = JSON.stringify({
-                    selector: selector,
-                    text: text,
-                    type: elementType
-                });
+        self.setPage(QWebEnginePage(_browser_profile(), self))
+        settings = self.settings()
+        for attribute, enabled in self._SETTINGS:
+            settings.setAttribute(attribute, enabled)
+
+        # Clicks arrive over QWebChannel as they happen instead of being polled for
+        self._selection_bridge = _SelectionBridge(self)
+        self._selection_bridge.selected.connect(self.handle_selection)
+        self.channel = QWebChannel(self.page())
+        self.channel.registerObject("bridge", self._selection_bridge)
+        self.page().setWebChannel(self.channel, _TARGETING_WORLD)
+        self._install_scripts()
+
+    def _install_scripts(self):
+        """Register qwebchannel.js and the targeting script once; Qt re-injects them on every navigation"""
+        api_file = QFile(":/qtwebchannel/qwebchannel.js")
+        if not api_file.open(QIODevice.ReadOnly):
+            print("🎯 qwebchannel.js not found; element targeting is unavailable")
+            return
+        channel_source = bytes(api_file.readAll()).decode("utf-8")
+        api_file.close()
+        targeting_source = (Path(__file__).parent / "assets" / "targeting.js").read_text(encoding="utf-8")
+
+        for name, source, injection_point in (
+                ("qwebchannel", channel_source, QWebEngineScript.DocumentCreation),
+                ("rag_targeting", targeting_source, QWebEngineScript.DocumentReady)):
+            script = QWebEngineScript()
+            script.setName(name)
+            script.setSourceCode(source)
+            script.setInjectionPoint(injection_point)
+            script.setWorldId(_TARGETING_WORLD)
+            script.setRunsOnSubFrames(False)
+            self.page().scripts().insert(script)
 
-                cleanup();
-            }
-        }
+    def set_targeting_widget(self, widget):
+        self.targeting_widget = widget
 
-        function cleanup() {
-            isSelecting = false;
-            if (highlighted) {
-                highlighted.style.outline = '';
-                highlighted.style.backgroundColor = '';
-            }
-            if (overlay) overlay.remove();
-            if (tooltip) tooltip.remove();
+    def handle_selection(self, payload: str):
+        """Handle an element pushed from the page"""
+        task = _ParseTask(payload)
+        task.signals.parsed.connect(self._on_selection_parsed)
+        QThreadPool.globalInstance().start(task)
 
-            document.removeEventListener('mouseover', handleMouseOver, true);
-            document.removeEventListener('click', handleClick, true);
-        }
+    def _on_selection_parsed(self, data: dict):
+        selector = data.get('selector', '')
+        text = data.get('text', '')
+        element_type = data.get('type', '')
 
-        // Store cleanup function globally
-        window._ragTargetingCleanup = cleanup;
+        self.element_selected.emit(selector, text, element_type)
+        if self.targeting_widget:
+            self.targeting_widget.update_selection(selector, text, element_type)
 
-        // Add event listeners
-        document.addEventListener('mouseover', handleMouseOver, true);
-        document.addEventListener('click', handleClick, true);
-        """
+    def enable_selector_mode(self):
+        """Enable element selection mode"""
+        if self.is_targeting_active:
+            return  # Already active
 
-        self.page().runJavaScript(js_code)
-        self.poll_timer.start(500)
+        self.is_targeting_active = True
+        self.page().runJavaScript("window.__ragSetEnabled && window.__ragSetEnabled(true);",
+                                  _TARGETING_WORLD)
 
     def disable_selector_mode(self):
         """Disable targeting mode"""
         self.is_targeting_active = False
-        self.poll_timer.stop()
-        cleanup_js = """
-        if (window._ragTargetingCleanup) {
-            window._ragTargetingCleanup();
-        }
-        window._ragSelection = null;
-        """
-        self.page().runJavaScript(cleanup_js)
+        self.page().runJavaScript("window.__ragSetEnabled && window.__ragSetEnabled(false);",
+                                  _TARGETING_WORLD)
 
 
 class ProjectManager(QWidget):
@@ -763,9 +863,7 @@ class ProjectManager(QWidget):
     def init_ui(self):
         layout = QVBoxLayout(self)
 
-        header = QLabel("📁 Projects")
-        header.setFont(QFont("Arial", 14, QFont.Bold))
-        header.setStyleSheet("color: #4CAF50; margin: 10px 0;")
+        header = _make_header("📁 Projects")
 
         self.project_list = QListWidget()
         self.project_list.itemClicked.connect(self.on_project_selected)
@@ -791,15 +889,18 @@ class ProjectManager(QWidget):
         if dialog.exec() == QDialog.Accepted:
             project = dialog.get_project_config()
             self.projects.append(project)
-            self.refresh_project_list()
+            self._append_project_item(project)  # One new row; no need to rebuild the others
+
+    def _append_project_item(self, project: ProjectConfig):
+        item = QListWidgetItem(f"{project.name} ({project.domain})")
+        item.setData(Qt.UserRole, project)
+        self.project_list.addItem(item)
 
     def refresh_project_list(self):
-        """Refresh project list"""
+        """Rebuild the whole project list (bulk loads)"""
         self.project_list.clear()
         for project in self.projects:
-            item = QListWidgetItem(f"{project.name} ({project.domain})")
-            item.setData(Qt.UserRole, project)
-            self.project_list.addItem(item)
+            self._append_project_item(project)
 
     def on_project_selected(self, item):
         """Handle project selection"""
@@ -827,10 +928,7 @@ class ProjectDialog(QDialog):
 
         self.domain_combo = QComboBox()
         self.domain_combo.setEditable(True)
-        self.domain_combo.addItems([
-            "sports", "finance", "legal", "medical", "e-commerce",
-            "real-estate", "news", "research", "education", "technology"
-        ])
+        self.domain_combo.addItems(_DOMAINS)
 
         self.websites_input = QTextEdit()
         self.websites_input.setPlaceholderText("Enter target websites, one per line")
@@ -899,14 +997,15 @@ class RulesManager(QWidget):
     def init_ui(self):
         layout = QVBoxLayout(self)
 
-        header = QLabel("📋 Scraping Rules")
-        header.setFont(QFont("Arial", 14, QFont.Bold))
-        header.setStyleSheet("color: #4CAF50; margin: 10px 0;")
+        header = _make_header("📋 Scraping Rules")
 
-        self.rules_table = QTableWidget()
-        self.rules_table.setColumnCount(3)
-        self.rules_table.setHorizontalHeaderLabels(["Name", "Type", "Selector"])
+        # Model/view rather than QTableWidget: cell values live in the model, no item object per cell
+        self.rules_model = QStandardItemModel(0, 3, self)
+        self.rules_model.setHorizontalHeaderLabels(["Name", "Type", "Selector"])
+        self.rules_table = QTableView()
+        self.rules_table.setModel(self.rules_model)
         self.rules_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.rules_table.setEditTriggers(QAbstractItemView.NoEditTriggers)  # Rules are edited through RuleEditDialog
 
         # Rule actions
         rule_actions_layout = QHBoxLayout()
@@ -958,20 +1057,20 @@ class RulesManager(QWidget):
         row = selected_rows[0].row()
         if 0 <= row < len(self.current_rules):
             rule = self.current_rules[row]
-            dialog = RuleEditDialog(rule, self)
+            before = rule.to_dict()  # The dialog edits in place; snapshot to detect a no-op save
+            dialog = RuleEditDialog(rule, self, taken_names=(r.name for r in self.current_rules if r is not rule))
             if dialog.exec() == QDialog.Accepted:
                 updated_rule = dialog.get_updated_rule()
+                if updated_rule.to_dict() == before:
+                    return  # Nothing changed: keep updated_at (and the cached pipeline config) as is
                 self.current_rules[row] = updated_rule
                 self.refresh_rules_table()
                 self.rule_updated.emit(updated_rule)
 
                 # Update in parent project
                 main_window = self.window()
-                if hasattr(main_window, 'current_project') and main_window.current_project:
-                    for i, project_rule in enumerate(main_window.current_project.scraping_rules):
-                        if project_rule.id == updated_rule.id:
-                            main_window.current_project.scraping_rules[i] = updated_rule
-                            break
+                if hasattr(main_window, 'update_rule_in_project'):
+                    main_window.update_rule_in_project(updated_rule)
 
     def delete_selected_rule(self):
         """Delete the selected rule"""
@@ -994,25 +1093,30 @@ class RulesManager(QWidget):
 
                 # Remove from parent project
                 main_window = self.window()
-                if hasattr(main_window, 'current_project') and main_window.current_project:
-                    main_window.current_project.scraping_rules = [
-                        r for r in main_window.current_project.scraping_rules
-                        if r.id != removed_rule.id
-                    ]
+                if hasattr(main_window, 'delete_rule_from_project'):
+                    main_window.delete_rule_from_project(removed_rule.id)
 
     def add_rule(self, rule: ScrapingRule):
         """Add rule to display"""
         self.current_rules.append(rule)
-        self.refresh_rules_table()
+        # Only the new row is added; existing rows are left alone
+        self.rules_model.appendRow([QStandardItem(value) for value in self._row_values(rule)])
+        self.rules_table.resizeColumnsToContents()
+
+    @staticmethod
+    def _row_values(rule: ScrapingRule) -> Tuple[str, str, str]:
+        return rule.name, rule.extract_type, rule.selector[:50] + "..."
 
     def refresh_rules_table(self):
         """Refresh rules table"""
-        self.rules_table.setRowCount(len(self.current_rules))
-
+        # Fill every cell with painting off, then repaint and size the columns once
+        model = self.rules_model
+        self.rules_table.setUpdatesEnabled(False)
+        model.setRowCount(len(self.current_rules))
         for row, rule in enumerate(self.current_rules):
-            self.rules_table.setItem(row, 0, QTableWidgetItem(rule.name))
-            self.rules_table.setItem(row, 1, QTableWidgetItem(rule.extract_type))
-            self.rules_table.setItem(row, 2, QTableWidgetItem(rule.selector[:50] + "..."))
+            for col, value in enumerate(self._row_values(rule)):
+                model.setData(model.index(row, col), value)
+        self.rules_table.setUpdatesEnabled(True)
 
         self.rules_table.resizeColumnsToContents()
 
@@ -1032,49 +1136,25 @@ class RulesManager(QWidget):
 
         filename, _ = QFileDialog.getSaveFileName(
             self, "Export Scraper Config",
-            f"{project.name.lower().replace(' ', '_')}_config.yaml",
-            "YAML files (*.yaml *.yml)"
+            f"{project.name.lower().replace(' ', '_')}_config.json",
+            "JSON files (*.json);;YAML files (*.yaml *.yml)"
         )
 
         if filename:
-            # Format EXACTLY like your backend expects
-            config_data = {
-                "domain_info": {
-                    "name": project.name,
-                    "description": project.description,
-                    "domain": project.domain
-                },
-                "sources": [{
-                    "name": project.name.lower().replace(' ', '_'),
-                    "seeds": project.target_websites,
-                    "source_type": project.domain,
-                    "selectors": {
-                        "custom_fields": [
-                            {
-                                "name": rule.name,
-                                "selector": rule.selector,
-                                "extract_type": rule.extract_type,
-                                "attribute_name": rule.attribute_name,
-                                "is_list": rule.is_list,
-                                "required": rule.required
-                            } for rule in self.current_rules
-                        ]
-                    },
-                    "crawl": {
-                        "depth": 1,
-                        "delay_seconds": 2.0,
-                        "respect_robots_txt": True
-                    },
-                    "export": {
-                        "format": "jsonl",
-                        "output_path": f"./data_exports/{project.domain}/{project.name.lower().replace(' ', '_')}.jsonl"
-                    }
-                }]
-            }
-
-            import yaml
-            with open(filename, 'w') as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+            config_data = main_window._prepare_project_data_for_pipeline()
+
+            # JSON unless a YAML name was chosen; the backend's yaml.safe_load reads either
+            if filename.lower().endswith(('.yaml', '.yml')):
+                import yaml
+                from utils.yaml_io import YamlDumper
+                with open(filename, 'w') as f:
+                    yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False, indent=2, sort_keys=False)
+            elif orjson is not None:
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(config_data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(filename, 'w', encoding='utf-8') as f:
+                    json.dump(config_data, f, indent=2)
 
             QMessageBox.information(self, "Export Complete",
                                     f"Scraper config exported to {filename}\n\n"
@@ -1088,12 +1168,22 @@ class RAGDataStudio(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_project = None
+        self._extraction_thread = None
+        self._extraction_worker = None
+        self._bridge = None
+        self._selector_test_url = ""
+        # Single-flight flags: a new selection re-enables Test, so a click can arrive while a test is still running
+        self._selector_test_running = False
+        self._rules_test_running = False
+        self._test_task: Optional[asyncio.Future] = None  # Held so the running Test All task isn't garbage-collected
+        self._rule_index: Dict[str, Tuple[ScrapingRule, List[ScrapingRule]]] = {}  # id -> (rule, owning list)
+        self._rule_names: set = set()  # Names in use in the current project, for clash checks
+        self._pipeline_cache: Optional[Tuple[Tuple[str, str], Dict[str, Any]]] = None  # ((id, updated_at), config)
         self.init_ui()
 
     def init_ui(self):
         self.setWindowTitle("RAG Data Studio - Visual Scraper Builder")
         self.setGeometry(100, 100, 1600, 1000)
-        self.setStyleSheet(DARK_THEME)
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -1117,17 +1207,24 @@ class RAGDataStudio(QMainWindow):
 
         self.load_btn = QPushButton("🌐 Load")
         self.selector_btn = QPushButton("🎯 Target Elements")
-        self.selector_btn.setProperty("class", "success")
+        self.selector_btn.setProperty("class", "targetBtn")  # Styled per :checked state by the theme
+        self.selector_btn.setCheckable(True)
 
         toolbar_layout.addWidget(QLabel("URL:"))
         toolbar_layout.addWidget(self.url_input)
         toolbar_layout.addWidget(self.load_btn)
         toolbar_layout.addWidget(self.selector_btn)
 
-        self.browser = InteractiveBrowser()
+        # QWebEngineView boots Chromium, so the browser is only created on first use
+        self.browser = None
+        self._center_layout = center_layout
+        self._browser_placeholder = QLabel("🌐 Enter a URL and click Load to start the browser")
+        self._browser_placeholder.setAlignment(Qt.AlignCenter)
+        self._pending_user_load = False
+        self._current_url = ""  # Last successfully loaded page; refreshed on loadFinished only
 
         center_layout.addLayout(toolbar_layout)
-        center_layout.addWidget(self.browser)
+        center_layout.addWidget(self._browser_placeholder)
         main_splitter.addWidget(center_widget)
 
         # Right panel - Targeting and rules
@@ -1154,69 +1251,342 @@ class RAGDataStudio(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready - Create a project and start building scrapers")
 
+        # Status writes (notably per-step pipeline progress) are coalesced into one repaint per 50 ms
+        self._status_pending: Optional[Tuple[str, int]] = None
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(50)
+        self._status_timer.timeout.connect(self._flush_status)
+
+        self.cancel_extraction_btn = QPushButton("⏹ Cancel Scrape")
+        self.cancel_extraction_btn.hide()
+        self.status_bar.addPermanentWidget(self.cancel_extraction_btn)
+
         # Connect signals
         self.load_btn.clicked.connect(self.load_page)
         self.selector_btn.clicked.connect(self.toggle_selector_mode)
         self.project_manager.project_selected.connect(self.load_project)
-        self.element_targeter.rule_created.connect(self.add_rule_to_project)
-        self.browser.set_targeting_widget(self.element_targeter)
+        self.element_targeter.test_selector_requested.connect(self.test_selector)
+        self.rules_manager.run_scrape_btn.clicked.connect(self.run_extraction_pipeline)
+        self.cancel_extraction_btn.clicked.connect(self.cancel_extraction)
+        self.rules_manager.test_all_btn.clicked.connect(self.run_all_rules_test)
+        self.url_input.returnPressed.connect(self.load_page)
+
+        # Keyboard shortcuts; application-wide so they work whichever panel has focus
+        for keys, slot in ((_KS_NEW, self.project_manager.create_new_project), (_KS_QUIT, self.close)):
+            shortcut = QShortcut(QKeySequence(keys), self)
+            shortcut.setContext(Qt.ApplicationShortcut)
+            shortcut.activated.connect(slot)
+
+    def _set_status(self, message: str, timeout: int = 0):
+        """Queue a status bar message; only the latest one in a burst is shown"""
+        self._status_pending = (message, timeout)
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+
+    def _flush_status(self):
+        if self._status_pending is not None:
+            self.status_bar.showMessage(*self._status_pending)
+            self._status_pending = None
+
+    def _ensure_browser(self) -> InteractiveBrowser:
+        """Create the browser on first use and swap it in for the placeholder"""
+        if self.browser is None:
+            self.browser = InteractiveBrowser()
+            self.browser.set_targeting_widget(self.element_targeter)
+            self.browser.loadFinished.connect(self._on_load_finished)  # Once, for the window's lifetime
+            self._center_layout.replaceWidget(self._browser_placeholder, self.browser)
+            self._browser_placeholder.deleteLater()
+            self._browser_placeholder = None
+        return self.browser
 
     def load_page(self):
         """Load page in browser"""
         url = self.url_input.text().strip()
         if url:
-            if not url.startswith(('http://', 'https://')):
+            if _SCHEME_RE.match(url):
+                qurl = QUrl(url)
+            elif (path := Path(url)).suffix.lower() in _HTML_SUFFIXES and path.is_file():
+                qurl = QUrl.fromLocalFile(str(path.resolve()))  # Saved pages can be targeted offline
+            else:
                 url = 'https://' + url
-            self.browser.load(QUrl(url))
-            self.status_bar.showMessage(f"Loading: {url}")
-
-    def toggle_selector_mode(self):
+                qurl = QUrl(url)
+            if self._bridge is not None:
+                self._bridge.invalidate_cache(qurl.toString())  # An explicit reload should re-test against the live page
+            self._pending_user_load = True
+            self._ensure_browser().load(qurl)
+            self._set_status(f"Loading: {url}")
+
+    def _on_load_finished(self, ok: bool):
+        """Remember the loaded URL and report the outcome of a load started from the URL bar"""
+        url = self.browser.url().toString()
+        self._current_url = url if ok else ""
+        if not self._pending_user_load:
+            return  # In-page navigation; leave the status bar alone
+        self._pending_user_load = False
+        self._set_status(f"Loaded: {url}" if ok else f"Failed to load: {url}")
+
+    def toggle_selector_mode(self, checked: bool):
         """Toggle visual element targeting mode"""
-        if self.selector_btn.text() == "🎯 Target Elements":
-            self.browser.enable_selector_mode()
+        if checked:
+            if not self._current_url:
+                self.selector_btn.setChecked(False)
+                self._set_status("Load a page before targeting elements")
+                return
+            self._ensure_browser().enable_selector_mode()
             self.selector_btn.setText("❌ Stop Targeting")
-            self.selector_btn.setProperty("class", "")
-            self.selector_btn.style().unpolish(self.selector_btn)
-            self.selector_btn.style().polish(self.selector_btn)
-            self.status_bar.showMessage("🎯 Targeting mode enabled - Click elements to create scraping rules")
+            self._set_status("🎯 Targeting mode enabled - Click elements to create scraping rules")
         else:
-            self.browser.disable_selector_mode()
+            self._ensure_browser().disable_selector_mode()
             self.selector_btn.setText("🎯 Target Elements")
-            self.selector_btn.setProperty("class", "success")
-            self.selector_btn.style().unpolish(self.selector_btn)
-            self.selector_btn.style().polish(self.selector_btn)
-            self.status_bar.showMessage("Targeting mode disabled")
+            self._set_status("Targeting mode disabled")
 
     def load_project(self, project: ProjectConfig):
         """Load selected project"""
         self.current_project = project
+        self._rebuild_rule_index()
         self.rules_manager.current_rules = project.scraping_rules.copy()
         self.rules_manager.refresh_rules_table()
 
         if project.target_websites:
             self.url_input.setText(project.target_websites[0])
 
-        self.status_bar.showMessage(f"Loaded project: {project.name} ({len(project.scraping_rules)} rules)")
+        self._set_status(f"Loaded project: {project.name} ({len(project.scraping_rules)} rules)")
 
-    def add_rule_to_project(self, rule: ScrapingRule):
-        """Add new rule to current project"""
+    def add_rule_to_project(self, rule: ScrapingRule) -> bool:
+        """Add new rule to current project; False (after telling the user why) if it can't be added"""
         if not self.current_project:
             QMessageBox.warning(self, "No Project", "Please select or create a project first.")
-            return
+            return False
+        if rule.name in self._rule_names:
+            QMessageBox.warning(self, "Duplicate Name", f"A rule named '{rule.name}' already exists in this project.")
+            return False
 
         self.current_project.scraping_rules.append(rule)
+        self._rule_index[rule.id] = (rule, self.current_project.scraping_rules)
+        self._rule_names.add(rule.name)
         self.current_project.updated_at = datetime.now().isoformat()
 
         self.rules_manager.add_rule(rule)
-        self.status_bar.showMessage(f"Added rule: {rule.name}")
+        self._set_status(f"Added rule: {rule.name}")
+        return True
+
+    def _rebuild_rule_index(self):
+        """Index the current project's rules by id so edits don't rescan the list"""
+        self._rule_index = {}
+        if self.current_project:
+            owner = self.current_project.scraping_rules
+            for rule in owner:
+                self._rule_index[rule.id] = (rule, owner)
+        self._rule_names = {rule.name for rule, _ in self._rule_index.values()}
+
+    def update_rule_in_project(self, rule: ScrapingRule):
+        """Store an edited rule back into the current project"""
+        entry = self._rule_index.get(rule.id)
+        if entry is None:
+            return
+        old_rule, owner = entry
+        if old_rule is not rule:  # RuleEditDialog edits in place, so this is normally a no-op
+            owner[owner.index(old_rule)] = rule
+            self._rule_index[rule.id] = (rule, owner)
+        self._rule_names = {r.name for r, _ in self._rule_index.values()}  # The edit may have renamed it
+        self.current_project.updated_at = datetime.now().isoformat()
+
+    def delete_rule_from_project(self, rule_id: str):
+        """Remove a rule from the current project"""
+        entry = self._rule_index.pop(rule_id, None)
+        if entry is None:
+            return
+        rule, owner = entry
+        owner.remove(rule)
+        self._rule_names.discard(rule.name)
+        self.current_project.updated_at = datetime.now().isoformat()
+
+    def _prepare_project_data_for_pipeline(self) -> Dict[str, Any]:
+        """Build the config dict in the exact shape the backend expects (shared; treat as read-only)"""
+        project = self.current_project
+        key = (project.id, project.updated_at)  # Every rule/project mutation bumps updated_at
+        if self._pipeline_cache is not None and self._pipeline_cache[0] == key:
+            return self._pipeline_cache[1]
+
+        slug = project.name.lower().replace(' ', '_')
+        config_data = {
+            "domain_info": {
+                "name": project.name,
+                "description": project.description,
+                "domain": project.domain
+            },
+            "sources": [{
+                "name": slug,
+                "seeds": project.target_websites,
+                "source_type": project.domain,
+                "selectors": {
+                    "custom_fields": [rule.to_backend_dict() for rule in project.scraping_rules]
+                },
+                "crawl": {
+                    "depth": 1,
+                    "delay_seconds": 2.0,
+                    "respect_robots_txt": True
+                },
+                "export": {
+                    "format": "jsonl",
+                    "output_path": f"./data_exports/{project.domain}/{slug}.jsonl"
+                }
+            }]
+        }
+        self._pipeline_cache = (key, config_data)
+        return config_data
+
+    def _get_bridge(self):
+        if self._bridge is None:
+            from rag_data_studio.integration.backend_bridge import RAGStudioBridge
+            self._bridge = RAGStudioBridge()
+            self._bridge.enable_file_logging()
+        return self._bridge
+
+    def test_selector(self, selector_config: Dict[str, Any]):
+        """Test one selector on the loaded page; the fetch and parse run on the thread pool"""
+        url = self._current_url
+        if not url:
+            self.element_targeter.test_btn.setEnabled(True)
+            QMessageBox.warning(self, "No Page", "Load a page before testing a selector.")
+            return
+        if self._selector_test_running:
+            return  # The running test re-enables the button when its results come in
+        from rag_data_studio.integration.backend_bridge import test_selectors_async
+        self._set_status(f"🧪 Testing selector on {url}...")
+        self._selector_test_url = url
+        self._selector_test_running = True
+        # A bound method of this window, so the pool thread's result is queued back to the GUI thread
+        test_selectors_async(self._get_bridge(), url, [selector_config], self._on_selector_tested)
+
+    def _on_selector_tested(self, results: Dict[str, Any]):
+        self._selector_test_running = False
+        self.element_targeter.test_btn.setEnabled(bool(self.element_targeter.current_selector))
+        self._set_status("Selector test complete")
+        from rag_data_studio.components.dialogs import TestResultsDialog
+        TestResultsDialog(results, self, test_url=self._selector_test_url).exec()
+
+    def run_all_rules_test(self):
+        """Test every rule against the project's target websites"""
+        project = self.current_project
+        if not project or not project.scraping_rules:
+            QMessageBox.warning(self, "No Rules", "Please select a project with scraping rules first.")
+            return
+        if self._rules_test_running:
+            return  # A test run is already in flight
+
+        # Same field dicts the pipeline gets (memoized on updated_at); the bridge ignores the extra keys
+        selectors_config = self._prepare_project_data_for_pipeline()["sources"][0]["selectors"]["custom_fields"]
+        urls = project.target_websites or ([self._current_url] if self._current_url else [])
+        self._rules_test_running = True
+        self.rules_manager.test_all_btn.setEnabled(False)
+        self._set_status(f"🧪 Testing {len(selectors_config)} rules on {len(urls)} page(s)...")
+        if QtAsyncio is None:
+            # No Qt-integrated event loop: run the blocking multi-URL test on the thread pool instead
+            from rag_data_studio.integration.backend_bridge import test_selectors_async
+            test_selectors_async(self._get_bridge(), urls, selectors_config, self._on_all_rules_tested)
+        else:
+            self._test_task = asyncio.ensure_future(self._execute_all_rules_test(urls, selectors_config))
+            self._test_task.add_done_callback(self._on_test_task_done)
+
+    async def _execute_all_rules_test(self, urls: List[str], selectors_config: List[Dict[str, Any]]):
+        # QtAsyncio's loop has no socket support (so no aiohttp here): the bridge's pooled requests session
+        # fetches the pages concurrently on an executor thread while the event loop keeps painting
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, self._get_bridge().test_selectors_on_urls, urls, selectors_config)
+        self._on_all_rules_tested(results)
+
+    def _on_test_task_done(self, task: asyncio.Future):
+        self._test_task = None
+        error = None if task.cancelled() else task.exception()  # Retrieving it keeps asyncio from logging it later
+        if task.cancelled() or error is not None:
+            self._rules_test_running = False
+            self.rules_manager.test_all_btn.setEnabled(True)
+        if error is not None:
+            self._set_status("❌ Rule test failed")
+            QMessageBox.critical(self, "Rule Test Error", f"Testing the rules failed:\n{error}")
+
+    def _on_all_rules_tested(self, results: Dict[str, Any]):
+        self._rules_test_running = False
+        self.rules_manager.test_all_btn.setEnabled(True)
+        self._set_status("Rule test complete")
+
+        from rag_data_studio.components.dialogs import TestResultsDialog
+        if "error" in results:
+            TestResultsDialog(results, self).exec()
+            return
+        for url, url_results in results.items():
+            TestResultsDialog(url_results, self, test_url=url).exec()
+
+    def run_extraction_pipeline(self):
+        """Run the backend scraper for the current project on a worker thread"""
+        if not self.current_project or not self.current_project.scraping_rules:
+            QMessageBox.warning(self, "No Rules", "Please select a project with scraping rules first.")
+            return
+        if self._extraction_thread is not None:
+            return  # A scrape is already running
+
+        self._extraction_thread = QThread(self)
+        self._extraction_worker = ExtractionWorker(self._prepare_project_data_for_pipeline())
+        self._extraction_worker.moveToThread(self._extraction_thread)
+
+        self._extraction_thread.started.connect(self._extraction_worker.run)
+        self._extraction_worker.progress.connect(self._on_extraction_progress)
+        self._extraction_worker.finished.connect(self._on_extraction_done)
+        self._extraction_worker.error.connect(self._on_extraction_error)
+        self._extraction_worker.cancelled.connect(self._on_extraction_cancelled)
+        self._extraction_worker.finished.connect(self._extraction_thread.quit)
+        self._extraction_worker.error.connect(self._extraction_thread.quit)
+        self._extraction_worker.cancelled.connect(self._extraction_thread.quit)
+        self._extraction_thread.finished.connect(self._on_extraction_thread_finished)
+
+        self.rules_manager.run_scrape_btn.setEnabled(False)
+        self.cancel_extraction_btn.show()
+        self._set_status(f"🚀 Running scraper for {self.current_project.name}...")
+        self._extraction_thread.start()
+
+    def cancel_extraction(self):
+        """Ask the running scrape to stop at its next progress step"""
+        if self._extraction_thread is not None:
+            self._extraction_thread.requestInterruption()
+            self.cancel_extraction_btn.setEnabled(False)
+            self._set_status("Cancelling scrape...")
+
+    def _on_extraction_progress(self, message: str, percentage: int):
+        self._set_status(f"🚀 {message} ({percentage}%)")
+
+    def _on_extraction_done(self, items: List[Dict[str, Any]], list_name: str):
+        self._set_status(f"Scrape complete: {len(items)} items")
+        from rag_data_studio.components.dialogs import ScrapedDataViewerDialog
+        ScrapedDataViewerDialog(items, self, list_name=list_name).exec()
+
+    def _on_extraction_error(self, message: str):
+        self._set_status(f"Scrape failed: {message}")
+        QMessageBox.critical(self, "Scrape Failed", message)
+
+    def _on_extraction_cancelled(self):
+        self._set_status("Scrape cancelled")
+
+    def _on_extraction_thread_finished(self):
+        self._extraction_worker.deleteLater()
+        self._extraction_thread.deleteLater()
+        self._extraction_worker = None
+        self._extraction_thread = None
+        self.rules_manager.run_scrape_btn.setEnabled(True)
+        self.cancel_extraction_btn.setEnabled(True)
+        self.cancel_extraction_btn.hide()
 
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setApplicationName("RAG Data Studio")
     app.setStyle("Fusion")
+    app.setStyleSheet(DARK_THEME)  # Parsed once here; every window and dialog inherits it
 
     window = RAGDataStudio()
     window.show()
 
-    sys.exit(app.exec())
\ No newline at end of file
+    if QtAsyncio is None:
+        sys.exit(app.exec())
+    QtAsyncio.run(handle_sigint=True)
\ No newline at end of file
@@ -146,6 +146,17 @@ class ConfigManager:
         self.config = None
         return False
 
+    def load_config_data(self, raw_config: Dict[str, Any]) -> bool:
+        """Validate an in-memory config dict (e.g. one built by the GUI) without a round trip through a file."""
+        try:
+            self.config = DomainScrapeConfig(**raw_config)
+            self.logger.info(f"Config loaded: {self.config.domain_info.get('name', 'Unknown Domain')}")
+            return True
+        except Exception as e_val:  # Pydantic validation errors and others
+            self.logger.error(f"Validation error for in-memory config: {e_val}", exc_info=True)
+        self.config = None
+        return False
+
     def get_sources(self) -> List[SourceConfig]:
         return self.config.sources if self.config else []
 
@@ -368,8 +368,10 @@ def run_professional_pipeline(
         logger_instance=None,
         progress_callback: Optional[Callable[[str, int], None]] = None,
         initial_content_type_hint: Optional[str] = None,
-        max_retries: int = 3
+        max_retries: int = 3,
+        config_data: Optional[Dict[str, Any]] = None
 ) -> Tuple[List[EnrichedItem], PipelineMetrics]:
+    """config_data, if given, is an already-built config dict and query_or_config_path only labels the run."""
     logger = logger_instance if logger_instance else logging.getLogger(
         getattr(config, 'DEFAULT_LOGGER_NAME', 'ModularRAGScraper'))
     if not logger.handlers:
@@ -393,13 +395,17 @@ def run_professional_pipeline(
         update_progress("Initializing Configuration", 1)
         path_exists = os.path.exists(query_or_config_path)
         is_valid_extension = query_or_config_path.lower().endswith((".yaml", ".yml", ".json"))
-        is_config_file_mode = path_exists and is_valid_extension
+        is_config_file_mode = config_data is not None or (path_exists and is_valid_extension)
 
         cfg_manager: ConfigManager
         domain_query_for_log = query_or_config_path
 
         if is_config_file_mode:
-            cfg_manager = ConfigManager(config_path=query_or_config_path, logger_instance=logger)
+            if config_data is not None:
+                cfg_manager = ConfigManager(logger_instance=logger)
+                cfg_manager.load_config_data(config_data)
+            else:
+                cfg_manager = ConfigManager(config_path=query_or_config_path, logger_instance=logger)
             if not cfg_manager.config:
                 error_msg = f"Failed to load or validate configuration file: '{query_or_config_path}'"
                 metrics.errors.append(error_msg)
@@ -16,6 +16,7 @@ from typing import Dict, List, Any
 # Your existing scraper imports
 from scraper.searcher import search_and_fetch
 from utils.logger import setup_logger
+from utils.yaml_io import YamlDumper
 
 
 class ScraperService:
@@ -196,7 +197,7 @@ class ScraperService:
 
             # Create temporary config file
             with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+                yaml.dump(config_data, f, Dumper=YamlDumper, default_flow_style=False, indent=2)
                 temp_config_path = f.name
 
             self.current_job["status"] = "scraping"
@@ -3,6 +3,7 @@
 FIXED VERSION - Element selection now works properly
 """
 
+import os
 import sys
 import json
 import uuid
@@ -21,6 +22,12 @@ except ImportError:
     print("Warning: scraper_service not found, client features disabled")
     ScraperClient = None
 
+# Trace output for the targeting/selection flow; set RAG_DEBUG=1 to see it
+_DEBUG = os.environ.get("RAG_DEBUG") == "1"
+
+_SEMANTIC_LABELS = ("entity_name", "entity_score", "entity_ranking", "entity_location",
+                    "entity_date", "content_title", "content_body")
+
 DARK_THEME = """
 QMainWindow, QWidget { background-color: #1e1e1e; color: #ffffff; font-family: Arial, sans-serif; }
 QPushButton { background-color: #404040; border: 1px solid #606060; border-radius: 4px; padding: 8px 16px; color: white; }
@@ -57,7 +64,7 @@ class Browser(QWebEngineView):
 
     def enable_targeting(self):
         """Enable targeting mode"""
-        print("🎯 Enabling targeting mode...")
+        if _DEBUG: print("🎯 Enabling targeting mode...")
         self.targeting_active = True
 
         # Simple, reliable JavaScript
@@ -200,7 +207,7 @@ class Browser(QWebEngineView):
 
         self.page().runJavaScript(js_code)
         self.poll_timer.start(500)
-        print("✅ Targeting JavaScript injected, polling started")
+        if _DEBUG: print("✅ Targeting JavaScript injected, polling started")
 
     def check_selection(self):
         """Check for element selection"""
@@ -209,7 +216,7 @@ class Browser(QWebEngineView):
 
         def handle_result(result):
             if result and result != "null":
-                print(f"📡 Received selection: {result}")
+                if _DEBUG: print(f"📡 Received selection: {result}")
                 try:
                     if isinstance(result, str):
                         data = json.loads(result)
@@ -224,7 +231,7 @@ class Browser(QWebEngineView):
                     text = data.get('text', '')
                     suggestions = data.get('suggestions', {})
 
-                    print(f"🎯 Emitting selection: {selector}")
+                    if _DEBUG: print(f"🎯 Emitting selection: {selector}")
                     self.element_selected.emit(selector, text, suggestions)
 
                 except Exception as e:
@@ -235,7 +242,7 @@ class Browser(QWebEngineView):
 
     def disable_targeting(self):
         """Disable targeting"""
-        print("🛑 Disabling targeting mode...")
+        if _DEBUG: print("🛑 Disabling targeting mode...")
         self.targeting_active = False
         self.poll_timer.stop()
 
@@ -289,9 +296,9 @@ class SelectorPanel(QWidget):
         buttons_layout.addWidget(self.container_btn)
         buttons_layout.addStretch()
 
-        self.current_btn.clicked.connect(lambda: self.use_suggestion('current'))
-        self.parent_btn.clicked.connect(lambda: self.use_suggestion('parent'))
-        self.container_btn.clicked.connect(lambda: self.use_suggestion('container'))
+        self.current_btn.clicked.connect(self._use_current_suggestion)
+        self.parent_btn.clicked.connect(self._use_parent_suggestion)
+        self.container_btn.clicked.connect(self._use_container_suggestion)
 
         selection_layout.addLayout(form_layout)
         selection_layout.addLayout(buttons_layout)
@@ -304,10 +311,7 @@ class SelectorPanel(QWidget):
         self.field_name.setPlaceholderText("e.g., player_name, ranking, points")
 
         self.semantic_label = QComboBox()
-        self.semantic_label.addItems([
-            "entity_name", "entity_score", "entity_ranking", "entity_location",
-            "entity_date", "content_title", "content_body"
-        ])
+        self.semantic_label.addItems(_SEMANTIC_LABELS)
 
         # Status label for feedback
         self.status_label = QLabel()
@@ -400,7 +404,7 @@ class SelectorPanel(QWidget):
 
     def update_selection(self, selector, text, suggestions):
         """Update with new element selection"""
-        print(f"🎯 SelectorPanel received: {selector}, text: {text[:50]}...")
+        if _DEBUG: print(f"🎯 SelectorPanel received: {selector}, text: {text[:50]}...")
 
         self.current_suggestions = suggestions
 
@@ -478,6 +482,16 @@ class SelectorPanel(QWidget):
             return all(word[0].isupper() for word in words if word)
         return False
 
+    # Named slots rather than lambdas, so each button is an ordinary slot connection on this panel
+    @Slot()
+    def _use_current_suggestion(self): self.use_suggestion('current')
+
+    @Slot()
+    def _use_parent_suggestion(self): self.use_suggestion('parent')
+
+    @Slot()
+    def _use_container_suggestion(self): self.use_suggestion('container')
+
     def use_suggestion(self, suggestion_type):
         """Use a suggested selector"""
         if suggestion_type not in self.current_suggestions:
@@ -502,7 +516,7 @@ class SelectorPanel(QWidget):
 
     def save_selector(self):
         """Save current selector"""
-        print("💾 Save button clicked!")
+        if _DEBUG: print("💾 Save button clicked!")
 
         field_name = self.field_name.text().strip()
         selector = self.selector_input.text().strip()
@@ -537,7 +551,7 @@ class SelectorPanel(QWidget):
 
         # Emit signal
         self.selector_created.emit(selector_data)
-        print(f"📡 Emitted selector: {selector_data}")
+        if _DEBUG: print(f"📡 Emitted selector: {selector_data}")
 
         # Clear form for next selection
         self.field_name.clear()
@@ -707,7 +721,7 @@ class ScraperPanel(QWidget):
 
     def add_selector(self, selector_data):
         """Add selector from selector panel"""
-        print(f"📋 ScraperPanel received selector: {selector_data}")
+        if _DEBUG: print(f"📋 ScraperPanel received selector: {selector_data}")
         self.selectors.append(selector_data)
         self.count_label.setText(f"📋 {len(self.selectors)} selectors ready")
         self.log_text.appendPlainText(f"✅ Added: {selector_data['name']}")
@@ -938,7 +952,7 @@ class SelectorScraperTool(QMainWindow):
         self.selector_panel.selector_created.connect(self.scraper_panel.add_selector)
         self.selector_panel.selector_created.connect(self.auto_fill_url)
 
-        print("🎯 SelectorScraperTool initialized with all signal connections")
+        if _DEBUG: print("🎯 SelectorScraperTool initialized with all signal connections")
 
     def load_page(self):
         """Load page"""
@@ -946,20 +960,20 @@ class SelectorScraperTool(QMainWindow):
         if url:
             if not url.startswith(('http://', 'https://')):
                 url = 'https://' + url
-            print(f"🌐 Loading: {url}")
+            if _DEBUG: print(f"🌐 Loading: {url}")
             self.browser.load(QUrl(url))
 
     def toggle_targeting(self):
         """Toggle targeting mode"""
         if self.target_btn.text() == "Target Elements":
-            print("🎯 Starting targeting mode...")
+            if _DEBUG: print("🎯 Starting targeting mode...")
             self.browser.enable_targeting()
             self.target_btn.setText("Stop Targeting")
             self.target_btn.setProperty("class", "")
             self.target_btn.style().polish(self.target_btn)
-            print("✅ Targeting mode active - click elements on the page!")
+            if _DEBUG: print("✅ Targeting mode active - click elements on the page!")
         else:
-            print("🛑 Stopping targeting mode...")
+            if _DEBUG: print("🛑 Stopping targeting mode...")
             self.browser.disable_targeting()
             self.target_btn.setText("Target Elements")
             self.target_btn.setProperty("class", "go")
@@ -970,7 +984,7 @@ class SelectorScraperTool(QMainWindow):
         current_url = self.browser.url().toString()
         if current_url and current_url != "about:blank":
             self.scraper_panel.target_url.setText(current_url)
-            print(f"🔗 Auto-filled URL: {current_url}")
+            if _DEBUG: print(f"🔗 Auto-filled URL: {current_url}")
 
 
 if __name__ == "__main__":
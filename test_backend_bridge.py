@@ -0,0 +1,48 @@
+"""
+Tests for the GUI <-> backend bridge. Skipped when the bridge's GUI/HTTP dependencies are not installed.
+"""
+import logging
+
+import pytest
+
+backend_bridge = pytest.importorskip("rag_data_studio.integration.backend_bridge")
+
+
+@pytest.fixture
+def bridge_logger():
+    logger = logging.getLogger("RAGStudioBridge")
+    handlers, level = logger.handlers[:], logger.level
+    yield logger
+    for handler in logger.handlers:
+        if handler not in handlers: handler.close()
+    logger.handlers[:] = handlers
+    logger.setLevel(level)
+
+
+def test_enable_file_logging_writes_bridge_records(tmp_path, bridge_logger):
+    log_file = tmp_path / "bridge.log"
+    bridge = backend_bridge.RAGStudioBridge()
+    try:
+        bridge.enable_file_logging(str(log_file))
+        bridge.enable_file_logging(str(log_file))  # Idempotent: still one file handler
+        bridge.logger.info("selector test finished")
+    finally:
+        bridge.close()
+    for handler in bridge_logger.handlers: handler.flush()
+
+    assert sum(isinstance(h, logging.FileHandler) for h in bridge_logger.handlers) == 1
+    assert "selector test finished" in log_file.read_text(encoding="utf-8")
+
+
+def test_selectors_on_file_url_read_from_disk(tmp_path):
+    page = tmp_path / "saved.html"
+    page.write_bytes(b"<html><body><h1 class='t'>Saved title</h1></body></html>")
+    bridge = backend_bridge.RAGStudioBridge()
+    try:
+        results = bridge.test_selectors_on_url(page.as_uri(), [{"name": "title", "selector": "h1.t"}])
+        missing = bridge.test_selectors_on_url((tmp_path / "gone.html").as_uri(), [{"name": "title", "selector": "h1"}])
+    finally:
+        bridge.close()
+
+    assert results["title"].success and results["title"].sample_values == ["Saved title"]
+    assert missing["error"].startswith("Failed to read file")
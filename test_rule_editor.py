@@ -0,0 +1,64 @@
+"""
+Tests for the rule editor's tree model. Skipped when PySide6 is not installed.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtTest = pytest.importorskip("PySide6.QtTest")
+from PySide6.QtCore import QModelIndex, QtMsgType, qInstallMessageHandler
+from PySide6.QtWidgets import QApplication
+
+from rag_data_studio.components.rule_editor import ScrapingRuleModel
+from rag_data_studio.core.models import ScrapingRule
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def model_warnings():
+    """Collects the QAbstractItemModelTester's complaints, which it reports as Qt warnings."""
+    messages = []
+    previous = qInstallMessageHandler(lambda mode, context, message: messages.append(message)
+                                      if mode in (QtMsgType.QtWarningMsg, QtMsgType.QtCriticalMsg) else None)
+    yield messages
+    qInstallMessageHandler(previous)
+
+
+def _rule(rule_id, *subs):
+    return ScrapingRule(id=rule_id, name=rule_id, selector=f".{rule_id}", sub_selectors=list(subs))
+
+
+def test_model_structure_survives_edits(app, model_warnings):
+    model = ScrapingRuleModel()
+    tester = QtTest.QAbstractItemModelTester(model, QtTest.QAbstractItemModelTester.FailureReportingMode.Warning)
+    players = _rule("players", _rule("name"), _rule("rank"), _rule("points"))
+    model.set_rules([_rule("title"), players, _rule("footer")])
+
+    model.add_rule(_rule("country"), "players")
+    model.add_rule(_rule("updated"))
+    assert model.remove_rule("rank")
+    assert model.remove_rule("title")
+
+    assert [r.id for r in players.sub_selectors] == ["name", "points", "country"]
+    for row, sub in enumerate(players.sub_selectors):
+        index = model.index_of(sub)
+        assert index.row() == row and model.rule_at(index) is sub
+        assert model.rule_at(model.parent(index)) is players
+    assert model.index_of(players).row() == 0
+    assert model.rowCount(QModelIndex()) == 3
+    assert not model_warnings, model_warnings
+    del tester
+
+
+def test_stale_rule_has_no_index(app):
+    model = ScrapingRuleModel()
+    stale = _rule("stale")
+    model.set_rules([stale, _rule("kept")])
+    assert model.remove_rule("stale")
+    assert not model.index_of(stale).isValid()
+    assert not model.remove_rule("stale")
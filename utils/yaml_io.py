@@ -0,0 +1,8 @@
+# utils/yaml_io.py
+"""
+The YAML dumper every config export shares.
+"""
+try:
+    from yaml import CSafeDumper as YamlDumper  # libyaml's C emitter when PyYAML was built with it
+except ImportError:
+    from yaml import SafeDumper as YamlDumper